@@ -3,6 +3,7 @@
 from functools import lru_cache
 from pathlib import Path
 
+from pydantic import field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -11,12 +12,15 @@ class Settings(BaseSettings):
 
     Configuration can be set via environment variables with GMAIL_MCP_ prefix.
     Example: GMAIL_MCP_CREDENTIALS_PATH=/path/to/credentials.json
+
+    Settings are read once (see get_settings) and are immutable afterwards.
     """
 
     model_config = SettingsConfigDict(
         env_prefix="GMAIL_MCP_",
         env_file=".env",
         env_file_encoding="utf-8",
+        frozen=True,
     )
 
     # OAuth paths - credentials.json from Google Cloud Console
@@ -25,9 +29,21 @@ class Settings(BaseSettings):
     # Token path - auto-generated after first OAuth flow
     token_path: Path = Path.home() / ".config" / "gmail-mcp" / "token.json"
 
+    # Optional SQLite cache of parsed messages - disabled when unset
+    cache_path: Path | None = None
+
+    # How long single requests wait for concurrent ones to share a Gmail batch
+    batch_max_wait_ms: float = 15.0
+
     # Gmail defaults
     default_max_results: int = 10
 
+    @field_validator("credentials_path", "token_path", "cache_path")
+    @classmethod
+    def _expand_user(cls, path: Path | None) -> Path | None:
+        """Expand ~ once at load time (MCP client configs commonly use ~/...)."""
+        return path.expanduser() if path is not None else None
+
 
 @lru_cache(maxsize=1)
 def get_settings() -> Settings:
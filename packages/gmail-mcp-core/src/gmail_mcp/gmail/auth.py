@@ -1,8 +1,12 @@
 """OAuth2 authentication for Gmail API."""
 
+import contextlib
+import hashlib
 import logging
 import os
-import stat
+import tempfile
+import threading
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
 from google.auth.transport.requests import Request
@@ -20,6 +24,22 @@ SCOPES = [
 ]
 
 
+# In-process cache of loaded credentials, keyed by (credentials_path, token_path).
+# Avoids re-reading and re-parsing the token file on every client construction.
+_CREDS_CACHE: dict[tuple[str, str], Credentials] = {}
+_CREDS_LOCK = threading.Lock()
+
+# Refresh tokens this long before expiry so user-facing calls never pay for it
+_REFRESH_MARGIN = timedelta(minutes=5)
+_REFRESH_TIMERS: dict[tuple[str, str], threading.Timer] = {}
+# Delay before retrying a failed background refresh
+_REFRESH_RETRY_DELAY = timedelta(seconds=30)
+
+# Digest of the token last written to (or loaded from) each token path;
+# unchanged tokens aren't rewritten
+_SAVED_TOKENS: dict[str, bytes] = {}
+
+
 class AuthenticationError(Exception):
     """Raised when authentication fails."""
 
@@ -39,12 +59,38 @@ def get_credentials(credentials_path: Path, token_path: Path) -> Credentials:
     Raises:
         AuthenticationError: If credentials file not found or auth fails.
     """
-    creds: Credentials | None = None
+    key = (str(credentials_path), str(token_path))
+    with _CREDS_LOCK:
+        cached = _CREDS_CACHE.get(key)
+        if cached is not None and cached.valid:
+            return cached
+
+        creds = _load_credentials(credentials_path, token_path, cached)
+        _CREDS_CACHE[key] = creds
+        _schedule_refresh(key, creds, token_path)
+        return creds
+
+
+def _load_credentials(
+    credentials_path: Path, token_path: Path, cached: Credentials | None
+) -> Credentials:
+    """Load, refresh or obtain credentials (caller must hold _CREDS_LOCK).
+
+    Args:
+        credentials_path: Path to OAuth client credentials JSON.
+        token_path: Path to store/load user token.
+        cached: Previously cached credentials, refreshed in place if expired.
+
+    Returns:
+        Valid Credentials object for Gmail API.
+    """
+    creds: Credentials | None = cached
 
     # Load existing token if available
-    if token_path.exists():
+    if creds is None and token_path.exists():
         try:
             creds = Credentials.from_authorized_user_file(str(token_path), SCOPES)
+            _SAVED_TOKENS[str(token_path)] = _token_digest(creds.to_json().encode("utf-8"))
         except Exception as e:
             # Token file corrupted or invalid, will re-authenticate
             logger.warning("Failed to load existing token, will re-authenticate: %s", e)
@@ -71,11 +117,116 @@ def get_credentials(credentials_path: Path, token_path: Path) -> Credentials:
             except Exception as e:
                 raise AuthenticationError(f"OAuth flow failed: {e}") from e
 
-        # Save token for future use with restrictive permissions
         if creds:
-            token_path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
-            token_path.write_text(creds.to_json())
-            # Restrict token file to owner-only read/write (contains refresh token)
-            os.chmod(token_path, stat.S_IRUSR | stat.S_IWUSR)  # 0o600
+            _save_token(creds, token_path)
 
     return creds
+
+
+def _save_token(creds: Credentials, token_path: Path) -> None:
+    """Save token for future use with restrictive permissions.
+
+    Skips the write when the token is unchanged since it was last saved or loaded.
+    Otherwise writes a temporary file and renames it over the token, so a crash
+    mid-write can't leave a truncated token behind.
+
+    Args:
+        creds: Credentials to persist.
+        token_path: Path to write the token to.
+    """
+    data = creds.to_json().encode("utf-8")
+    digest = _token_digest(data)
+    if _SAVED_TOKENS.get(str(token_path)) == digest:
+        return
+
+    token_path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+    # mkstemp creates the file owner-only (0o600), so the refresh token is never
+    # readable by others, even briefly
+    fd, tmp_name = tempfile.mkstemp(dir=token_path.parent, prefix=f".{token_path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, token_path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp_name)
+        raise
+    _SAVED_TOKENS[str(token_path)] = digest
+
+
+def _token_digest(data: bytes) -> bytes:
+    """Digest of serialized token data, for detecting unchanged tokens."""
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _schedule_refresh(key: tuple[str, str], creds: Credentials, token_path: Path) -> None:
+    """Schedule a background refresh shortly before the access token expires.
+
+    Caller must hold _CREDS_LOCK. Replaces any refresh already scheduled for key.
+
+    Args:
+        key: Cache key of the credentials.
+        creds: Credentials to refresh.
+        token_path: Path to persist the refreshed token to.
+    """
+    previous = _REFRESH_TIMERS.pop(key, None)
+    if previous is not None:
+        previous.cancel()
+
+    if creds.expiry is None or not creds.refresh_token:
+        return
+
+    # google-auth stores expiry as naive UTC
+    now = datetime.now(UTC).replace(tzinfo=None)
+    delay = (creds.expiry - now - _REFRESH_MARGIN).total_seconds()
+    if delay <= 0:
+        return
+
+    _start_refresh_timer(key, token_path, delay)
+
+
+def _start_refresh_timer(key: tuple[str, str], token_path: Path, delay: float) -> None:
+    """Start a daemon timer that refreshes key's credentials after delay seconds.
+
+    Caller must hold _CREDS_LOCK.
+    """
+    timer = threading.Timer(delay, _refresh_in_background, args=(key, token_path))
+    timer.daemon = True
+    _REFRESH_TIMERS[key] = timer
+    timer.start()
+
+
+def _refresh_in_background(key: tuple[str, str], token_path: Path) -> None:
+    """Refresh cached credentials in place and schedule the next refresh.
+
+    On failure a retry is scheduled: every 30 seconds while the current token
+    is still valid (never later than its expiry), then every few minutes.
+
+    Args:
+        key: Cache key of the credentials.
+        token_path: Path to persist the refreshed token to.
+    """
+    with _CREDS_LOCK:
+        creds = _CREDS_CACHE.get(key)
+        if creds is None:
+            return
+        try:
+            creds.refresh(Request())
+        except Exception as e:
+            # The server never calls get_credentials again once its client exists,
+            # so dropping the timer here would end proactive refresh for good
+            now = datetime.now(UTC).replace(tzinfo=None)
+            remaining = creds.expiry - now if creds.expiry is not None else _REFRESH_MARGIN
+            retry = min(_REFRESH_RETRY_DELAY, remaining)
+            if retry <= timedelta(0):
+                # Already expired; requests refresh on use meanwhile
+                retry = _REFRESH_MARGIN
+            logger.warning(
+                "Background token refresh failed, retrying in %ds: %s", retry.total_seconds(), e
+            )
+            _start_refresh_timer(key, token_path, retry.total_seconds())
+            return
+        _save_token(creds, token_path)
+        _schedule_refresh(key, creds, token_path)
@@ -0,0 +1,122 @@
+"""Persistent on-disk cache of parsed Gmail messages."""
+
+import logging
+import os
+import sqlite3
+import stat
+import threading
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+
+from pydantic import ValidationError
+
+from gmail_mcp.gmail.models import EmailSummary
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS messages (
+    email_id TEXT PRIMARY KEY,
+    history_id TEXT,
+    has_body INTEGER NOT NULL,
+    summary TEXT NOT NULL
+)
+"""
+
+# SQLite's default limit on bound parameters per statement is 999
+_MAX_PARAMS = 900
+
+
+class MessageCache:
+    """SQLite-backed cache of parsed EmailSummary objects keyed by message ID.
+
+    Message content is immutable once delivered; only labels change. Entries
+    record the historyId they were fetched at so callers can tell when labels
+    need refreshing.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Open (or create) the cache database.
+
+        Args:
+            path: Path to the SQLite database file.
+        """
+        path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+        # Cached summaries include message content; restrict to owner-only access.
+        # The file is created (or tightened) before SQLite opens it, as SQLite
+        # gives the -wal and -shm files the same mode as the database
+        os.close(os.open(path, os.O_RDWR | os.O_CREAT, stat.S_IRUSR | stat.S_IWUSR))
+        os.chmod(path, stat.S_IRUSR | stat.S_IWUSR)  # 0o600
+        # Accessed from worker threads; all use of the connection goes through _lock
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(_SCHEMA)
+            self._conn.commit()
+
+    def get_many(
+        self, email_ids: Sequence[str], require_body: bool = False
+    ) -> dict[str, tuple[EmailSummary, str | None, bool]]:
+        """Look up cached summaries.
+
+        Args:
+            email_ids: Message IDs to look up.
+            require_body: Skip entries cached without a body preview.
+
+        Returns:
+            Mapping of message ID to (summary, historyId, has_body) for each cache hit.
+            Entries that no longer validate as an EmailSummary count as misses.
+        """
+        rows: list[tuple[str, str | None, int, str]] = []
+        with self._lock:
+            for start in range(0, len(email_ids), _MAX_PARAMS):
+                chunk = email_ids[start : start + _MAX_PARAMS]
+                placeholders = ",".join("?" * len(chunk))
+                rows.extend(
+                    self._conn.execute(
+                        "SELECT email_id, history_id, has_body, summary FROM messages "
+                        f"WHERE email_id IN ({placeholders})",
+                        chunk,
+                    )
+                )
+
+        hits: dict[str, tuple[EmailSummary, str | None, bool]] = {}
+        for email_id, history_id, has_body, summary in rows:
+            if require_body and not has_body:
+                continue
+            try:
+                email = EmailSummary.model_validate_json(summary)
+            except ValidationError:
+                # Written by an older EmailSummary (or corrupted); refetching
+                # the message replaces the entry
+                logger.debug("Ignoring unreadable cache entry for %s", email_id)
+                continue
+            hits[email_id] = (email, history_id, bool(has_body))
+        return hits
+
+    def put_many(self, entries: Iterable[tuple[EmailSummary, str | None, bool]]) -> None:
+        """Insert or replace cached summaries.
+
+        Args:
+            entries: (summary, historyId, has_body) tuples to store.
+        """
+        rows = [
+            (summary.email_id, history_id, int(has_body), summary.model_dump_json())
+            for summary, history_id, has_body in entries
+        ]
+        if not rows:
+            return
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO messages (email_id, history_id, has_body, summary) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
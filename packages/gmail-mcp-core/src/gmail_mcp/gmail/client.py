@@ -2,18 +2,35 @@
 
 import asyncio
 import base64
+import binascii
+import contextlib
+import functools
+import html
+import itertools
 import logging
-import re
+import sys
+import threading
+import weakref
+from collections.abc import Callable, Sequence
+from concurrent.futures import Executor, ThreadPoolExecutor
 from datetime import datetime
-from email.mime.text import MIMEText
-from email.utils import parsedate_to_datetime
+from email import policy
+from email.errors import HeaderParseError
+from email.header import decode_header, make_header
+from email.message import EmailMessage
+from email.utils import parseaddr, parsedate_to_datetime
+from pathlib import Path
 from typing import Any
 
+import orjson
 from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import Resource, build
 from googleapiclient.errors import HttpError
-from googleapiclient.http import BatchHttpRequest
+from googleapiclient.http import BatchHttpRequest, HttpRequest, build_http
+from googleapiclient.model import JsonModel
 
+from gmail_mcp.gmail.cache import MessageCache
 from gmail_mcp.gmail.exceptions import (
     GmailAPIError,
     GmailMessageNotFoundError,
@@ -24,9 +41,292 @@ from gmail_mcp.gmail.models import DraftReplyResult, EmailSummary
 
 logger = logging.getLogger(__name__)
 
-# Pre-compiled regex patterns for header parsing
-_NAME_PATTERN = re.compile(r'"?([^"<]+)"?\s*<')
-_EMAIL_PATTERN = re.compile(r"<([^>]+)>")
+# Headers _parse_message reads from each message, in str.title() form since
+# senders vary the case (e.g. "Message-ID" vs "Message-Id")
+_SUMMARY_HEADERS = frozenset({"From", "Subject", "Date", "Message-Id"})
+
+# Partial-response field masks: only return what get_unread_emails reads
+_LIST_FIELDS = "messages/id,nextPageToken"
+_MESSAGE_FIELDS = (
+    "id,threadId,snippet,labelIds,historyId,"
+    "payload(mimeType,headers,body/data,parts(mimeType,filename,body/data,parts))"
+)
+_LABELS_FIELDS = "id,labelIds,historyId"
+
+# Shared label tuples: nearly every message carries one of a few combinations
+# (INBOX, UNREAD, CATEGORY_*), so summaries reference one tuple per combination
+_LABEL_INTERN: dict[tuple[str, ...], tuple[str, ...]] = {}
+_LABEL_INTERN_MAX = 1024
+
+# Messages per batch shard, and how many shards run at once
+_BATCH_SHARD_SIZE = 20
+_MAX_BATCH_SHARDS = 5
+
+# Gmail rejects batches of more than 100 requests
+_MAX_BATCH_REQUESTS = 100
+
+# Individual requests in flight at once when the batch endpoint is down; Gmail
+# answers more concurrent requests per user with 429s
+_MAX_CONCURRENT_REQUESTS = 10
+# Retries for individual GETs failing with 429/5xx, with googleapiclient's
+# jittered exponential backoff
+_REQUEST_RETRIES = 3
+
+_BatchResult = tuple[dict[str, dict[str, Any]], list[tuple[str, Exception]]]
+
+# Header values up to this long fit on one line (RFC 5322 caps lines at 998
+# chars) and are written without folding
+_MAX_PLAIN_HEADER_CHARS = 900
+# RFC 5322 line length limit, excluding the CRLF
+_MAX_LINE_OCTETS = 998
+
+# Maps Gmail's URL-safe base64 alphabet onto the standard one
+_URLSAFE_TO_STD = bytes.maketrans(b"-_", b"+/")
+
+
+def _b64decode_urlsafe(data: str) -> bytes:
+    """Decode URL-safe base64, tolerating missing padding.
+
+    Equivalent to base64.urlsafe_b64decode without its intermediate copies.
+
+    Args:
+        data: URL-safe base64 text.
+
+    Returns:
+        Decoded bytes.
+    """
+    raw = data.encode("ascii").translate(_URLSAFE_TO_STD)
+    if len(raw) % 4 == 1:
+        # A lone trailing character can't encode a byte; drop it
+        raw = raw[:-1]
+    return binascii.a2b_base64(raw + b"=" * (-len(raw) % 4))
+
+
+@functools.lru_cache(maxsize=2048)
+def _parse_date_cached(date_str: str) -> datetime:
+    """Parse an RFC 2822 date, memoized since digests and list batches repeat them.
+
+    Failures raise rather than return, so they are never cached.
+    """
+    return parsedate_to_datetime(date_str)
+
+
+def _parse_date(date_str: str) -> datetime:
+    """Parse email date header to datetime.
+
+    Args:
+        date_str: Date string from email header.
+
+    Returns:
+        Parsed datetime (or current time if parsing fails).
+    """
+    if not date_str:
+        return datetime.now()
+    try:
+        return _parse_date_cached(date_str)
+    except (TypeError, ValueError):
+        return datetime.now()
+
+
+def _intern_labels(label_ids: Sequence[str]) -> tuple[str, ...]:
+    """Return a shared tuple for this combination of labels.
+
+    Args:
+        label_ids: Label IDs from a Gmail message.
+
+    Returns:
+        Interned tuple of the same labels.
+    """
+    key = tuple(label_ids)
+    labels = _LABEL_INTERN.get(key)
+    if labels is None:
+        if len(_LABEL_INTERN) >= _LABEL_INTERN_MAX:
+            _LABEL_INTERN.clear()
+        labels = _LABEL_INTERN.setdefault(key, key)
+    return labels
+
+
+def _header_value(value: str) -> str:
+    """Collapse line breaks in a header value so it can't inject further headers.
+
+    Args:
+        value: Raw header value.
+
+    Returns:
+        Single-line header value.
+    """
+    return " ".join(value.splitlines())
+
+
+def _parse_from(from_header: str) -> tuple[str | None, str]:
+    """Split a From header into display name and address in one parseaddr pass.
+
+    Args:
+        from_header: Full From header value.
+
+    Returns:
+        Tuple of (display name or None, address). The address falls back to the
+        raw header if it can't be parsed.
+    """
+    name, address = parseaddr(from_header)
+    if "@" not in address:
+        # parseaddr splits at unquoted commas (Exchange's "Doe, John <john@...>")
+        # and stops at the first space of a bare name; take the bracketed address
+        # and what precedes it, or failing that the whole header
+        start, end = from_header.rfind("<"), from_header.rfind(">")
+        if start != -1 and end > start:
+            name = from_header[:start].strip().strip('"').strip()
+            address = from_header[start + 1 : end].strip()
+        else:
+            name, address = "", from_header.strip()
+    # parseaddr leaves RFC 2047 encoded-words (=?utf-8?b?...?=) in the name;
+    # the substring check keeps plain names off the decoding path
+    if "=?" in name:
+        with contextlib.suppress(HeaderParseError, LookupError, UnicodeDecodeError):
+            name = str(make_header(decode_header(name)))
+    return name or None, address or from_header.strip()
+
+
+def _body_transfer_encoding(body: str) -> str:
+    """Pick the Content-Transfer-Encoding for a plain text body.
+
+    8bit keeps the body readable as is, but is only valid while every line fits
+    in 998 octets; longer lines are quoted-printable encoded, which soft-wraps them.
+
+    Args:
+        body: Plain text body with LF line endings.
+
+    Returns:
+        "8bit" or "quoted-printable".
+    """
+    for line in body.split("\n"):
+        # UTF-8 needs at most 4 bytes per character, so shorter lines can't overflow
+        if len(line) > _MAX_LINE_OCTETS // 4 and len(line.encode("utf-8")) > _MAX_LINE_OCTETS:
+            return "quoted-printable"
+    return "8bit"
+
+
+def _build_reply_raw(
+    to_address: str, subject: str, reply_body: str, original_msg_id_header: str
+) -> str:
+    """Build a base64url-encoded RFC 822 plain text reply.
+
+    Plain ASCII headers short enough for one line, with a body that can go as
+    8bit, are written directly; anything needing RFC 2047 encoding, folding or
+    a quoted-printable body goes through EmailMessage.
+
+    Args:
+        to_address: Recipient address.
+        subject: Reply subject line.
+        reply_body: Plain text body.
+        original_msg_id_header: Message-ID of the email being replied to (may be empty).
+
+    Returns:
+        Raw message suitable for the Gmail API "raw" field.
+    """
+    to_header = _header_value(to_address)
+    subject = _header_value(subject)
+    msg_id = _header_value(original_msg_id_header)
+    # Normalize CRLF and bare CR to LF, so the body never carries a CR outside a CRLF
+    body = reply_body.replace("\r\n", "\n").replace("\r", "\n")
+    cte = _body_transfer_encoding(body)
+
+    if cte != "8bit" or not all(
+        value.isascii() and len(value) <= _MAX_PLAIN_HEADER_CHARS
+        for value in (to_header, subject, msg_id)
+    ):
+        return _build_reply_raw_encoded(to_header, subject, body, msg_id, cte)
+
+    headers = [f"To: {to_header}", f"Subject: {subject}"]
+    # Threading headers per RFC 2822
+    if msg_id:
+        headers.append(f"In-Reply-To: {msg_id}")
+        headers.append(f"References: {msg_id}")
+    headers += [
+        "MIME-Version: 1.0",
+        'Content-Type: text/plain; charset="utf-8"',
+        "Content-Transfer-Encoding: 8bit",
+    ]
+
+    raw_bytes = ("\r\n".join(headers) + "\r\n\r\n" + body.replace("\n", "\r\n")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw_bytes).decode("ascii")
+
+
+def _build_reply_raw_encoded(
+    to_header: str, subject: str, body: str, msg_id: str, cte: str = "8bit"
+) -> str:
+    """Build the reply through EmailMessage, which encodes and folds headers.
+
+    Args:
+        to_header: Single-line recipient header value.
+        subject: Single-line subject.
+        body: Plain text body with LF line endings.
+        msg_id: Single-line Message-ID of the original email (may be empty).
+        cte: Content-Transfer-Encoding for the body.
+
+    Returns:
+        Raw message suitable for the Gmail API "raw" field.
+    """
+    message = EmailMessage(policy=policy.SMTP)
+    message["To"] = to_header
+    message["Subject"] = subject
+    if msg_id:
+        message["In-Reply-To"] = msg_id
+        message["References"] = msg_id
+    message.set_content(body, charset="utf-8", cte=cte)
+    return base64.urlsafe_b64encode(message.as_bytes()).decode("ascii")
+
+
+class _OrjsonModel(JsonModel):  # type: ignore[misc]  # JsonModel is untyped
+    """JsonModel that parses response bodies with orjson.
+
+    Applies to every response received through the service, including the
+    individual responses inside a batch. Request bodies keep JsonModel's
+    json.dumps: googleapiclient sends them as str with a len()-based
+    Content-Length, which is only correct for the ASCII-escaped output.
+    """
+
+    def deserialize(self, content: bytes | str) -> Any:
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            return content.decode("utf-8") if isinstance(content, bytes) else content
+        if self._data_wrapper and isinstance(body, dict) and "data" in body:
+            body = body["data"]
+        return body
+
+
+# Built services keyed by id(credentials); build() parses the discovery document
+# on every call, so clients sharing credentials share one Resource
+_SERVICE_CACHE: "weakref.WeakValueDictionary[int, Resource]" = weakref.WeakValueDictionary()
+
+
+def _build_service(credentials: Credentials) -> Resource:
+    """Build (or reuse) the Gmail API service for the given credentials.
+
+    Args:
+        credentials: OAuth2 credentials the service authorizes with.
+
+    Returns:
+        Gmail API Resource.
+    """
+    service = _SERVICE_CACHE.get(id(credentials))
+    # Guard against id() reuse after the original credentials were collected
+    if service is not None and getattr(service._http, "credentials", None) is credentials:
+        return service
+
+    # Use the discovery document bundled with googleapiclient rather than
+    # fetching it over HTTP on every cold start
+    service = build(
+        "gmail",
+        "v1",
+        credentials=credentials,
+        model=_OrjsonModel(),
+        static_discovery=True,
+        cache_discovery=False,
+    )
+    _SERVICE_CACHE[id(credentials)] = service
+    return service
 
 
 def _convert_http_error(error: HttpError, context: str = "") -> GmailAPIError:
@@ -54,22 +354,162 @@ def _convert_http_error(error: HttpError, context: str = "") -> GmailAPIError:
         return GmailAPIError(message, status_code=status)
 
 
+class _BatchCoalescer:
+    """Coalesces single API requests issued close together into shared batches.
+
+    The first submitted request starts a max_wait_ms timer; everything submitted
+    before it fires (up to 100 requests) goes out as one batch, so back-to-back
+    tool calls share a round trip instead of paying one each.
+    """
+
+    def __init__(
+        self,
+        execute: Callable[[list[tuple[str, HttpRequest]]], _BatchResult],
+        executor: Executor,
+        max_wait_ms: float,
+    ) -> None:
+        """Initialize the coalescer.
+
+        Args:
+            execute: Blocking function that executes (request_id, request) pairs.
+            executor: Executor to run execute on.
+            max_wait_ms: How long a request may wait for others to join its batch.
+        """
+        self._execute = execute
+        self._executor = executor
+        self._max_wait = max_wait_ms / 1000
+        self._ids = itertools.count()
+        self._pending: list[tuple[str, HttpRequest, asyncio.Future[dict[str, Any]]]] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+
+    async def submit(self, request: HttpRequest) -> dict[str, Any]:
+        """Queue a request for the next batch and wait for its response.
+
+        Args:
+            request: Request to execute.
+
+        Returns:
+            The request's response.
+
+        Raises:
+            HttpError: If the request, or the batch carrying it, failed.
+            GmailAPIError: If the batch could not be sent.
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[dict[str, Any]] = loop.create_future()
+        self._pending.append((str(next(self._ids)), request, future))
+        if len(self._pending) >= _MAX_BATCH_REQUESTS:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self._max_wait, self._flush)
+        return await future
+
+    def close(self) -> None:
+        """Send any requests still waiting for their batch timer, e.g. on shutdown."""
+        if self._pending:
+            self._flush()
+
+    def _flush(self) -> None:
+        """Send all pending requests as one batch."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        pending, self._pending = self._pending, []
+
+        try:
+            done = asyncio.get_running_loop().run_in_executor(
+                self._executor,
+                self._execute,
+                [(request_id, request) for request_id, request, _ in pending],
+            )
+        except RuntimeError as e:
+            # The executor is shut down (client closed); fail the callers
+            # rather than leave them waiting forever
+            for _, _, future in pending:
+                if not future.done():
+                    future.set_exception(GmailAPIError(f"Request not sent: {e}"))
+            return
+        done.add_done_callback(functools.partial(self._resolve, pending))
+
+    @staticmethod
+    def _resolve(
+        pending: list[tuple[str, HttpRequest, "asyncio.Future[dict[str, Any]]"]],
+        done: "asyncio.Future[_BatchResult]",
+    ) -> None:
+        """Hand each waiting caller its response or error."""
+        batch_error = done.exception()
+        responses, errors = ({}, []) if batch_error is not None else done.result()
+        request_errors = dict(errors)
+
+        for request_id, _, future in pending:
+            # Callers may have been cancelled while the batch was in flight
+            if future.done():
+                continue
+            if batch_error is not None:
+                future.set_exception(batch_error)
+            elif request_id in responses:
+                future.set_result(responses[request_id])
+            else:
+                future.set_exception(
+                    request_errors.get(request_id) or GmailAPIError("No response in batch")
+                )
+
+
 class GmailClient:
     """Wrapper for Gmail API operations."""
 
-    def __init__(self, credentials: Credentials) -> None:
+    def __init__(
+        self,
+        credentials: Credentials,
+        cache_path: Path | None = None,
+        batch_max_wait_ms: float = 15.0,
+    ) -> None:
         """Initialize Gmail client with credentials.
 
         Args:
             credentials: Valid OAuth2 credentials for Gmail API.
+            cache_path: Optional SQLite file for caching parsed messages across calls.
+            batch_max_wait_ms: How long single requests (draft creation and its
+                lookup) wait for concurrent ones to share a batch. With 0 they
+                still share one when issued in the same event loop iteration.
         """
-        self._service: Resource = build("gmail", "v1", credentials=credentials)
+        self._credentials = credentials
+        self._local = threading.local()
+        self._service: Resource = _build_service(credentials)
+        # Dedicated pool for blocking API calls, isolated from the loop's default
+        # executor so unrelated to_thread work can't hold up Gmail calls
+        self._executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="gmail")
+        self._batch_executor = ThreadPoolExecutor(
+            max_workers=_MAX_BATCH_SHARDS, thread_name_prefix="gmail-batch"
+        )
+        # Shared by all shards, so the pool size caps concurrency for the whole client
+        self._fallback_executor = ThreadPoolExecutor(
+            max_workers=_MAX_CONCURRENT_REQUESTS, thread_name_prefix="gmail-fallback"
+        )
+        self._cache: MessageCache | None = MessageCache(cache_path) if cache_path else None
+        self._coalescer = _BatchCoalescer(
+            self._execute_coalesced, self._executor, batch_max_wait_ms
+        )
+
+    async def aclose(self) -> None:
+        """Shut down worker threads and close the message cache.
+
+        Requests already submitted are sent and complete first; later ones fail
+        with GmailAPIError.
+        """
+        self._coalescer.close()
+        await asyncio.to_thread(self._executor.shutdown)
+        await asyncio.to_thread(self._batch_executor.shutdown)
+        await asyncio.to_thread(self._fallback_executor.shutdown)
+        if self._cache is not None:
+            self._cache.close()
 
     async def get_unread_emails(
         self,
         max_results: int = 10,
         label_ids: list[str] | None = None,
         page_token: str | None = None,
+        body_preview: bool = False,
     ) -> tuple[list[EmailSummary], bool, str | None]:
         """Fetch unread emails with summaries.
 
@@ -77,13 +517,19 @@ class GmailClient:
             max_results: Maximum number of emails to return.
             label_ids: Gmail labels to filter by (default: INBOX).
             page_token: Token for pagination (from previous call).
+            body_preview: Also fetch message bodies, decoded into body_preview (up
+                to 500 characters). By default only headers are fetched and
+                body_preview is Gmail's snippet.
 
         Returns:
             Tuple of (list of email summaries, has_more flag, next_page_token).
         """
         # Run blocking API calls in thread pool to not block event loop
-        return await asyncio.to_thread(
-            self._get_unread_emails_sync, max_results, label_ids, page_token
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor,
+            functools.partial(
+                self._get_unread_emails_sync, max_results, label_ids, page_token, body_preview
+            ),
         )
 
     def _get_unread_emails_sync(
@@ -91,6 +537,7 @@ class GmailClient:
         max_results: int,
         label_ids: list[str] | None,
         page_token: str | None,
+        body_preview: bool = False,
     ) -> tuple[list[EmailSummary], bool, str | None]:
         """Synchronous implementation of get_unread_emails."""
         labels = label_ids or ["INBOX"]
@@ -101,12 +548,17 @@ class GmailClient:
             "q": "is:unread",
             "labelIds": labels,
             "maxResults": max_results,
+            "fields": _LIST_FIELDS,
         }
         if page_token:
             list_params["pageToken"] = page_token
 
+        # Each users()/messages() call builds a fresh Resource from the discovery
+        # document, so resolve the collection once and reuse it for every request
+        messages_api = self._service.users().messages()
+
         try:
-            results = self._service.users().messages().list(**list_params).execute()
+            results = messages_api.list(**list_params).execute(http=self._thread_http())
         except HttpError as e:
             logger.error("Failed to list messages: %s", e)
             raise _convert_http_error(e, "list messages") from e
@@ -118,37 +570,52 @@ class GmailClient:
         if not messages:
             return [], has_more, next_page_token
 
-        # Use batch request to fetch all messages in 1-2 API calls (vs N+1)
-        # Gmail batch API supports up to 100 requests per batch
-        fetched_messages: dict[str, dict[str, Any]] = {}
-        batch_errors: list[tuple[str, Exception]] = []
-
-        def message_callback(
-            request_id: str, response: dict[str, Any], exception: Exception | None
-        ) -> None:
-            if exception is None:
-                fetched_messages[request_id] = response
-            else:
-                batch_errors.append((request_id, exception))
-
-        batch: BatchHttpRequest = self._service.new_batch_http_request(callback=message_callback)
-        for msg in messages:
-            batch.add(
-                self._service.users()
-                .messages()
-                .get(
+        # Metadata format returns only the headers we parse plus the snippet,
+        # typically 10-50x fewer bytes than the full MIME tree; bodies are only
+        # fetched when asked for
+        get_params: dict[str, Any] = {
+            "format": "metadata",
+            "metadataHeaders": sorted(_SUMMARY_HEADERS),
+            "fields": _MESSAGE_FIELDS,
+        }
+        if body_preview:
+            get_params = {"format": "full", "fields": _MESSAGE_FIELDS}
+        labels_params = {"format": "minimal", "fields": _LABELS_FIELDS}
+
+        # Message content never changes once delivered, so cache hits only need
+        # a minimal fetch for their current labels and historyId
+        cached: dict[str, tuple[EmailSummary, str | None, bool]] = {}
+        if self._cache is not None:
+            cached = self._cache.get_many([msg["id"] for msg in messages], body_preview)
+
+        # Use batch requests to fetch all messages in a few API calls (vs N+1)
+        requests = [
+            (
+                msg["id"],
+                messages_api.get(
                     userId="me",
                     id=msg["id"],
-                    format="full",
+                    **(labels_params if msg["id"] in cached else get_params),
                 ),
-                request_id=msg["id"],
             )
+            for msg in messages
+        ]
+        # A batch completes only when its slowest sub-request does, so larger
+        # listings are split into shards that run concurrently
+        shards = [
+            requests[start : start + _BATCH_SHARD_SIZE]
+            for start in range(0, len(requests), _BATCH_SHARD_SIZE)
+        ]
+        if len(shards) == 1:
+            results = [self._execute_batch(shards[0])]
+        else:
+            results = list(self._batch_executor.map(self._execute_batch, shards))
 
-        try:
-            batch.execute()
-        except HttpError as e:
-            logger.error("Batch request failed: %s", e)
-            raise _convert_http_error(e, "batch fetch messages") from e
+        fetched_messages: dict[str, dict[str, Any]] = {}
+        batch_errors: list[tuple[str, Exception]] = []
+        for shard_messages, shard_errors in results:
+            fetched_messages.update(shard_messages)
+            batch_errors.extend(shard_errors)
 
         # Log any individual message fetch errors (but don't fail the whole request)
         for msg_id, error in batch_errors:
@@ -156,12 +623,154 @@ class GmailClient:
 
         # Parse messages in original order
         emails: list[EmailSummary] = []
+        updates: list[tuple[EmailSummary, str | None, bool]] = []
         for msg in messages:
-            if msg["id"] in fetched_messages:
-                emails.append(self._parse_message(fetched_messages[msg["id"]]))
+            response = fetched_messages.get(msg["id"])
+            if response is None:
+                continue
+            history_id = response.get("historyId")
+            if msg["id"] in cached:
+                email, cached_history_id, has_body = cached[msg["id"]]
+                if history_id != cached_history_id:
+                    refreshed_labels = _intern_labels(response.get("labelIds", ()))
+                    email = email.model_copy(update={"labels": refreshed_labels})
+                    updates.append((email, history_id, has_body))
+            else:
+                email = self._parse_message(response, body_preview)
+                updates.append((email, history_id, body_preview))
+            emails.append(email)
+
+        if self._cache is not None:
+            self._cache.put_many(updates)
 
         return emails, has_more, next_page_token
 
+    def _execute_batch(
+        self,
+        requests: list[tuple[str, HttpRequest]],
+        context: str | None = "batch fetch messages",
+    ) -> _BatchResult:
+        """Execute requests as a single Gmail batch.
+
+        Args:
+            requests: (request_id, request) pairs; at most 100 per batch.
+            context: Context for the GmailAPIError raised when the whole batch
+                fails. With None the HttpError is raised as is, for callers
+                that convert it with their own context.
+
+        Returns:
+            Tuple of (responses by request ID, per-request errors).
+        """
+        responses: dict[str, dict[str, Any]] = {}
+        errors: list[tuple[str, Exception]] = []
+
+        def callback(
+            request_id: str, response: dict[str, Any], exception: Exception | None
+        ) -> None:
+            if exception is None:
+                responses[request_id] = response
+            else:
+                errors.append((request_id, exception))
+
+        batch: BatchHttpRequest = self._service.new_batch_http_request(callback=callback)
+        for request_id, request in requests:
+            batch.add(request, request_id=request_id)
+
+        try:
+            batch.execute(http=self._thread_http())
+        except HttpError as e:
+            status = e.resp.status if e.resp else None
+            if status is not None and status >= 500:
+                # Batch endpoint unavailable - the individual endpoints may still answer.
+                # Its sub-requests may have run regardless (e.g. a 504 after the work
+                # was done), so only reads are replayed; the rest fail with the batch
+                # error rather than risk landing twice
+                logger.warning("Batch request failed, fetching individually: %s", e)
+                reads = [pair for pair in requests if pair[1].method == "GET"]
+                responses, errors = self._execute_individually(reads) if reads else ({}, [])
+                errors.extend(
+                    (request_id, e) for request_id, request in requests if request.method != "GET"
+                )
+                return responses, errors
+            logger.error("Batch request failed: %s", e)
+            if context is None:
+                raise
+            raise _convert_http_error(e, context) from e
+
+        return responses, errors
+
+    def _execute_individually(self, requests: list[tuple[str, HttpRequest]]) -> _BatchResult:
+        """Execute requests individually, e.g. as a fallback when a batch fails.
+
+        Requests run concurrently on the fallback pool, and GETs rejected with
+        429 or 5xx are retried with backoff.
+
+        Args:
+            requests: (request_id, request) pairs.
+
+        Returns:
+            Tuple of (responses by request ID, per-request errors).
+        """
+        responses: dict[str, dict[str, Any]] = {}
+        errors: list[tuple[str, Exception]] = []
+
+        def execute(request: HttpRequest) -> dict[str, Any]:
+            # A retried create could land twice, so only reads are retried
+            retries = _REQUEST_RETRIES if request.method == "GET" else 0
+            response: dict[str, Any] = request.execute(
+                http=self._thread_http(), num_retries=retries
+            )
+            return response
+
+        # Not worth a thread hop for a single request
+        if len(requests) == 1:
+            request_id, request = requests[0]
+            try:
+                responses[request_id] = execute(request)
+            except HttpError as e:
+                errors.append((request_id, e))
+            return responses, errors
+
+        futures = [
+            (request_id, self._fallback_executor.submit(execute, request))
+            for request_id, request in requests
+        ]
+        for request_id, future in futures:
+            try:
+                responses[request_id] = future.result()
+            except HttpError as e:
+                errors.append((request_id, e))
+        return responses, errors
+
+    def _execute_coalesced(self, requests: list[tuple[str, HttpRequest]]) -> _BatchResult:
+        """Execute requests gathered by the coalescer.
+
+        Args:
+            requests: (request_id, request) pairs.
+
+        Returns:
+            Tuple of (responses by request ID, per-request errors).
+        """
+        # A batch of one is a multipart round trip with nothing to amortize
+        if len(requests) == 1:
+            return self._execute_individually(requests)
+        # Requests belong to different callers, each of which reports a failed
+        # batch in its own terms
+        return self._execute_batch(requests, context=None)
+
+    def _thread_http(self) -> AuthorizedHttp:
+        """Get the calling thread's authorized connection, creating it on first use.
+
+        httplib2 connections aren't thread-safe, so each worker thread keeps its
+        own. Connections persist across calls, so repeat requests from the same
+        thread reuse the open TLS session instead of handshaking again.
+        """
+        http: AuthorizedHttp | None = getattr(self._local, "http", None)
+        if http is None:
+            http = AuthorizedHttp(self._credentials, http=build_http())
+            self._local.http = http
+        return http
+
     async def create_draft_reply(
         self,
         thread_id: str,
@@ -169,6 +778,7 @@ class GmailClient:
         reply_body: str,
         original_subject: str,
         to_address: str,
+        original_msgid_header: str | None = None,
     ) -> DraftReplyResult:
         """Create a draft reply in a thread.
 
@@ -184,69 +794,28 @@ class GmailClient:
             reply_body: Plain text body of the reply.
             original_subject: Subject of the original email.
             to_address: Email address to send reply to.
+            original_msgid_header: Message-ID header of the original email, if already
+                known (EmailSummary.message_id_header). Skips fetching the original.
 
         Returns:
             DraftReplyResult with draft details.
         """
-        # Run blocking API calls in thread pool to not block event loop
-        return await asyncio.to_thread(
-            self._create_draft_reply_sync,
-            thread_id,
-            original_message_id,
-            reply_body,
-            original_subject,
-            to_address,
-        )
-
-    def _create_draft_reply_sync(
-        self,
-        thread_id: str,
-        original_message_id: str,
-        reply_body: str,
-        original_subject: str,
-        to_address: str,
-    ) -> DraftReplyResult:
-        """Synchronous implementation of create_draft_reply."""
-        # Get original message for Message-ID header
-        try:
-            original = (
-                self._service.users()
-                .messages()
-                .get(
-                    userId="me",
-                    id=original_message_id,
-                    format="metadata",
-                    metadataHeaders=["Message-ID"],
-                )
-                .execute()
-            )
-        except HttpError as e:
-            logger.error("Failed to get original message %s: %s", original_message_id, e)
-            raise _convert_http_error(e, original_message_id) from e
-
-        original_msg_id_header = self._get_header(original, "Message-ID")
+        if original_msgid_header is None:
+            original_msgid_header = await self._get_original_msgid_header(original_message_id)
 
         # Build subject with Re: prefix if needed
         subject = original_subject
-        if not subject.lower().startswith("re:"):
+        if subject[:3].lower() != "re:":
             subject = f"Re: {subject}"
 
-        # Build MIME message with proper threading headers
-        message = MIMEText(reply_body)
-        message["to"] = to_address
-        message["subject"] = subject
-
-        # Threading headers per RFC 2822
-        if original_msg_id_header:
-            message["In-Reply-To"] = original_msg_id_header
-            message["References"] = original_msg_id_header
-
-        raw = base64.urlsafe_b64encode(message.as_bytes()).decode()
+        raw = _build_reply_raw(to_address, subject, reply_body, original_msgid_header)
 
         draft_body = {"message": {"raw": raw, "threadId": thread_id}}
 
+        # Goes out in a shared batch with any other requests issued meanwhile
+        request = self._service.users().drafts().create(userId="me", body=draft_body)
         try:
-            draft = self._service.users().drafts().create(userId="me", body=draft_body).execute()
+            draft = await self._coalescer.submit(request)
         except HttpError as e:
             logger.error("Failed to create draft in thread %s: %s", thread_id, e)
             raise _convert_http_error(e, "create draft") from e
@@ -257,31 +826,78 @@ class GmailClient:
             message_id=draft["message"]["id"],
         )
 
-    def _parse_message(self, msg: dict[str, Any]) -> EmailSummary:
+    async def _get_original_msgid_header(self, original_message_id: str) -> str:
+        """Fetch the Message-ID header of the email being replied to.
+
+        Args:
+            original_message_id: Gmail message ID of the original email.
+
+        Returns:
+            Message-ID header value or empty string.
+        """
+        request = (
+            self._service.users()
+            .messages()
+            .get(
+                userId="me",
+                id=original_message_id,
+                format="metadata",
+                metadataHeaders=["Message-ID"],
+            )
+        )
+        try:
+            original = await self._coalescer.submit(request)
+        except HttpError as e:
+            logger.error("Failed to get original message %s: %s", original_message_id, e)
+            raise _convert_http_error(e, original_message_id) from e
+
+        return self._get_header(original, "Message-ID")
+
+    def _parse_message(self, msg: dict[str, Any], body_preview: bool = False) -> EmailSummary:
         """Parse Gmail API message into EmailSummary.
 
         Args:
             msg: Raw message dict from Gmail API.
+            body_preview: Whether msg was fetched with its body (full format), to
+                preview instead of the snippet.
 
         Returns:
             Parsed EmailSummary.
         """
-        headers = {h["name"]: h["value"] for h in msg["payload"].get("headers", [])}
-
-        sender = headers.get("From", "")
-        sender_name = self._extract_name(sender)
-
-        return EmailSummary(
+        # Messages routinely carry dozens of headers (Received, DKIM, ARC, List-*);
+        # collect only the ones needed and stop once all are found
+        headers: dict[str, str] = {}
+        for header in msg["payload"].get("headers", ()):
+            name = header["name"].title()
+            if name in _SUMMARY_HEADERS and name not in headers:
+                headers[name] = header["value"]
+                if len(headers) == len(_SUMMARY_HEADERS):
+                    break
+
+        # Parse the From header once for both name and address
+        sender_name, sender_email = _parse_from(headers.get("From", ""))
+
+        # Gmail's snippet is HTML-escaped and ~200 chars. Metadata-format messages
+        # have no body to decode, so it is the preview; fetched bodies give a longer
+        # one, falling back to the snippet when there is no text/plain part
+        snippet = msg.get("snippet", "")
+        preview = html.unescape(snippet)
+        if body_preview:
+            preview = self._extract_body(msg["payload"], max_chars=500) or preview
+
+        # Values are already the declared types, so skip validation
+        return EmailSummary.model_construct(
             email_id=msg["id"],
             thread_id=msg["threadId"],
-            sender=self._extract_email(sender),
-            sender_name=sender_name,
+            sender=sys.intern(sender_email),
+            sender_name=sys.intern(sender_name) if sender_name else None,
             subject=headers.get("Subject", "(no subject)"),
-            snippet=msg.get("snippet", ""),
-            body_preview=self._extract_body(msg["payload"], max_chars=500),
-            received_at=self._parse_date(headers.get("Date", "")),
+            snippet=snippet,
+            body_preview=preview,
+            received_at=_parse_date(headers.get("Date", "")),
             has_attachments=self._has_attachments(msg["payload"]),
-            labels=msg.get("labelIds", []),
+            labels=_intern_labels(msg.get("labelIds", ())),
+            message_id_header=headers.get("Message-Id"),
         )
 
     def _get_header(self, msg: dict[str, Any], name: str) -> str:
@@ -294,8 +910,10 @@ class GmailClient:
         Returns:
             Header value or empty string.
         """
+        # Header names are case-insensitive
+        name = name.lower()
         for header in msg.get("payload", {}).get("headers", []):
-            if header["name"] == name:
+            if header["name"].lower() == name:
                 return header["value"]
         return ""
 
@@ -309,10 +927,7 @@ class GmailClient:
             Display name or None.
         """
         # Format: "Display Name <email@example.com>" or just "email@example.com"
-        match = _NAME_PATTERN.match(from_header)
-        if match:
-            return match.group(1).strip()
-        return None
+        return _parse_from(from_header)[0]
 
     def _extract_email(self, from_header: str) -> str:
         """Extract email address from From header.
@@ -323,15 +938,15 @@ class GmailClient:
         Returns:
             Email address.
         """
-        match = _EMAIL_PATTERN.search(from_header)
-        if match:
-            return match.group(1)
-        # If no angle brackets, assume the whole thing is an email
-        return from_header.strip()
+        return _parse_from(from_header)[1]
 
     def _extract_body(self, payload: dict[str, Any], max_chars: int = 500) -> str:
         """Extract plain text body from message payload.
 
+        Walks the MIME tree depth-first with an explicit stack, returning the
+        first text/plain part that carries data. HTML parts are never decoded;
+        HTML-only messages yield "" so callers fall back to the snippet.
+
         Args:
             payload: Message payload from Gmail API.
             max_chars: Maximum characters to return (default 500).
@@ -344,62 +959,45 @@ class GmailClient:
         # Use generous limit to ensure we get enough characters
         max_base64_bytes = max_chars * 6
 
-        # Check for direct body data
-        body_data = payload.get("body", {}).get("data", "")
-        if body_data:
-            # Truncate base64 data before decoding to avoid processing huge emails
-            truncated = body_data[:max_base64_bytes]
-            # Ensure we truncate at a valid base64 boundary (multiple of 4)
-            truncated = truncated[: len(truncated) - (len(truncated) % 4)]
-            if truncated:
-                return base64.urlsafe_b64decode(truncated).decode("utf-8", errors="replace")
-
-        # Check parts for text/plain
-        for part in payload.get("parts", []):
-            if part.get("mimeType") == "text/plain":
+        stack = [payload]
+        while stack:
+            part = stack.pop()
+            # Multipart containers carry no body data of their own; a missing
+            # MIME type defaults to text/plain per RFC 2045
+            if part.get("mimeType", "text/plain") == "text/plain":
                 data = part.get("body", {}).get("data", "")
                 if data:
-                    truncated = data[:max_base64_bytes]
-                    truncated = truncated[: len(truncated) - (len(truncated) % 4)]
-                    if truncated:
-                        return base64.urlsafe_b64decode(truncated).decode("utf-8", errors="replace")
-
-            # Recursively check nested parts
-            if part.get("parts"):
-                result = self._extract_body(part, max_chars)
-                if result:
-                    return result
+                    # Truncate base64 data before decoding to avoid processing huge emails,
+                    # cutting at a valid base64 boundary (multiple of 4)
+                    if len(data) > max_base64_bytes:
+                        data = data[: max_base64_bytes - (max_base64_bytes % 4)]
+                    text = _b64decode_urlsafe(data).decode("utf-8", errors="replace")
+                    return text[:max_chars]
+            # Push children reversed so they are visited in document order
+            stack.extend(reversed(part.get("parts", ())))
 
         return ""
 
-    def _parse_date(self, date_str: str) -> datetime:
-        """Parse email date header to datetime.
-
-        Args:
-            date_str: Date string from email header.
-
-        Returns:
-            Parsed datetime (or current time if parsing fails).
-        """
-        if not date_str:
-            return datetime.now()
-        try:
-            return parsedate_to_datetime(date_str)
-        except Exception:
-            return datetime.now()
-
     def _has_attachments(self, payload: dict[str, Any]) -> bool:
         """Check if message has attachments.
 
+        Exact for full-format payloads. Metadata-format payloads carry no
+        parts, so for those this is a heuristic based on the MIME type.
+
         Args:
             payload: Message payload from Gmail API.
 
         Returns:
-            True if message has attachments.
+            True if message has (or, from metadata alone, likely has) attachments.
         """
-        for part in payload.get("parts", []):
+        if "parts" not in payload:
+            # Attachments are usually sent as multipart/mixed
+            return payload.get("mimeType") == "multipart/mixed"
+
+        stack = list(payload["parts"])
+        while stack:
+            part = stack.pop()
             if part.get("filename"):
                 return True
-            if part.get("parts") and self._has_attachments(part):
-                return True
+            stack.extend(part.get("parts", ()))
         return False
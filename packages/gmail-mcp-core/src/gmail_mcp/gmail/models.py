@@ -2,28 +2,48 @@
 
 from datetime import datetime
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class EmailSummary(BaseModel):
     """Summary of an email returned by get_unread_emails."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     email_id: str = Field(description="Unique Gmail message ID")
     thread_id: str = Field(description="Thread ID for reply threading")
     sender: str = Field(description="Sender email address")
     sender_name: str | None = Field(default=None, description="Sender display name if available")
     subject: str = Field(description="Email subject line")
     snippet: str = Field(description="Short preview of email body (~100 chars)")
-    body_preview: str = Field(description="Extended body preview (~500 chars)")
+    body_preview: str = Field(
+        description="Body preview (Gmail's snippet or up to ~500 chars of body)"
+    )
     received_at: datetime = Field(description="When the email was received")
-    has_attachments: bool = Field(default=False, description="Whether email has attachments")
-    labels: list[str] = Field(default_factory=list, description="Gmail labels on the message")
+    has_attachments: bool = Field(
+        default=False,
+        description=(
+            "Whether email has attachments. Exact when bodies were fetched "
+            "(include_body_preview); otherwise guessed from a multipart/mixed MIME type"
+        ),
+    )
+    # Tuples rather than lists: cheaper to build and share, and summaries are frozen
+    labels: tuple[str, ...] = Field(
+        default_factory=tuple, description="Gmail labels on the message"
+    )
+    message_id_header: str | None = Field(
+        default=None,
+        description="RFC 822 Message-ID header (pass to create_draft_reply to skip a lookup)",
+    )
 
 
 class UnreadEmailsResult(BaseModel):
     """Result of get_unread_emails tool."""
 
-    emails: list[EmailSummary] = Field(description="List of unread email summaries")
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    # A tuple so results stay immutable and can be shared between calls
+    emails: tuple[EmailSummary, ...] = Field(description="List of unread email summaries")
     total_count: int = Field(description="Number of emails returned")
     has_more: bool = Field(description="Whether more unread emails exist beyond the limit")
     next_page_token: str | None = Field(
@@ -35,6 +55,8 @@ class UnreadEmailsResult(BaseModel):
 class DraftReplyResult(BaseModel):
     """Result of create_draft_reply tool."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     draft_id: str = Field(description="Created draft ID")
     thread_id: str = Field(description="Thread the draft belongs to")
     message_id: str = Field(description="Message ID of the draft")
@@ -1,6 +1,10 @@
 """Gmail MCP Server - FastMCP server with Gmail tools."""
 
-from typing import Annotated
+import asyncio
+import threading
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Annotated, Any
 
 from fastmcp import FastMCP
 from pydantic import EmailStr, Field
@@ -10,8 +14,18 @@ from gmail_mcp.gmail.auth import get_credentials
 from gmail_mcp.gmail.client import GmailClient
 from gmail_mcp.gmail.models import DraftReplyResult, UnreadEmailsResult
 
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP[Any]) -> AsyncIterator[dict[str, Any]]:
+    """Close the Gmail client when the server shuts down."""
+    try:
+        yield {}
+    finally:
+        await _client_manager.reset()
+
+
 # Initialize FastMCP server
-mcp = FastMCP("Gmail MCP Server")
+mcp = FastMCP("Gmail MCP Server", lifespan=_lifespan)
 
 
 class GmailClientManager:
@@ -22,23 +36,49 @@ class GmailClientManager:
 
     def __init__(self) -> None:
         self._client: GmailClient | None = None
+        self._lock = threading.Lock()
 
     def get_client(self) -> GmailClient:
-        """Get or create Gmail client with credentials."""
-        if self._client is None:
-            settings = get_settings()
-            credentials = get_credentials(settings.credentials_path, settings.token_path)
-            self._client = GmailClient(credentials)
-        return self._client
+        """Get or create Gmail client with credentials.
+
+        Thread-safe; aget_client calls this from a worker thread.
+        """
+        with self._lock:
+            if self._client is None:
+                settings = get_settings()
+                credentials = get_credentials(settings.credentials_path, settings.token_path)
+                self._client = GmailClient(
+                    credentials,
+                    cache_path=settings.cache_path,
+                    batch_max_wait_ms=settings.batch_max_wait_ms,
+                )
+            return self._client
+
+    async def aget_client(self) -> GmailClient:
+        """Get or create Gmail client from async code.
+
+        Only the first call, which loads credentials from disk (and possibly
+        refreshes them over the network), hops to a worker thread.
+        """
+        client = self._client
+        if client is not None:
+            return client
+        return await asyncio.to_thread(self.get_client)
 
-    def reset(self) -> None:
-        """Reset client instance (useful for testing)."""
-        self._client = None
+    async def reset(self) -> None:
+        """Close and discard the client instance (on shutdown, and useful for testing)."""
+        with self._lock:
+            client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
 
 
 # Single instance for the server - can be replaced in tests
 _client_manager = GmailClientManager()
 
+# Result for the common "no new mail" poll; shared since results are frozen
+_EMPTY_RESULT = UnreadEmailsResult(emails=(), total_count=0, has_more=False)
+
 
 def get_gmail_client() -> GmailClient:
     """Get Gmail client instance.
@@ -49,6 +89,69 @@ def get_gmail_client() -> GmailClient:
     return _client_manager.get_client()
 
 
+# Tool parameter types. FastMCP builds each tool's input schema from these once,
+# when the tool is registered
+MaxResults = Annotated[
+    int,
+    Field(
+        default=10,
+        ge=1,
+        le=50,
+        description="Maximum number of emails to return (1-50)",
+    ),
+]
+LabelFilter = Annotated[
+    list[str] | None,
+    Field(
+        default=None,
+        description="Gmail labels to filter by (default: INBOX). Example: ['INBOX', 'IMPORTANT']",
+    ),
+]
+PageToken = Annotated[
+    str | None,
+    Field(
+        default=None,
+        description="Pagination token from previous call's next_page_token to fetch next page",
+    ),
+]
+IncludeBodyPreview = Annotated[
+    bool,
+    Field(
+        default=False,
+        description="Also fetch message bodies so body_preview can show more than the snippet (slower)",
+    ),
+]
+ThreadId = Annotated[
+    str,
+    Field(description="Thread ID from get_unread_emails - identifies the conversation"),
+]
+OriginalMessageId = Annotated[
+    str,
+    Field(
+        description="Message ID (email_id from get_unread_emails) - the specific email being replied to"
+    ),
+]
+ReplyBody = Annotated[
+    str,
+    Field(description="Plain text body of the reply message"),
+]
+OriginalSubject = Annotated[
+    str,
+    Field(description="Subject line of the original email (Re: prefix will be added if needed)"),
+]
+ToAddress = Annotated[
+    EmailStr,
+    Field(description="Email address to send the reply to (usually the original sender)"),
+]
+OriginalMessageIdHeader = Annotated[
+    str | None,
+    Field(
+        default=None,
+        description="message_id_header from get_unread_emails, if available - avoids looking up the original email",
+    ),
+]
+
+
 @mcp.tool(
     name="get_unread_emails",
     description="Retrieve unread emails from Gmail inbox with sender, subject, body preview, and thread information for replying",
@@ -58,49 +161,39 @@ def get_gmail_client() -> GmailClient:
     },
 )
 async def get_unread_emails(
-    max_results: Annotated[
-        int,
-        Field(
-            default=10,
-            ge=1,
-            le=50,
-            description="Maximum number of emails to return (1-50)",
-        ),
-    ] = 10,
-    labels: Annotated[
-        list[str] | None,
-        Field(
-            default=None,
-            description="Gmail labels to filter by (default: INBOX). Example: ['INBOX', 'IMPORTANT']",
-        ),
-    ] = None,
-    page_token: Annotated[
-        str | None,
-        Field(
-            default=None,
-            description="Pagination token from previous call's next_page_token to fetch next page",
-        ),
-    ] = None,
+    max_results: MaxResults = 10,
+    labels: LabelFilter = None,
+    page_token: PageToken = None,
+    include_body_preview: IncludeBodyPreview = False,
 ) -> UnreadEmailsResult:
     """Fetch unread emails from Gmail.
 
     Returns email summaries including:
     - sender: Email address and display name
     - subject: Email subject line
-    - body_preview: First ~500 characters of body
+    - body_preview: Gmail's snippet, or with include_body_preview up to ~500
+      characters of the body
     - email_id: Unique message ID (use with create_draft_reply)
     - thread_id: Thread ID (use with create_draft_reply)
+    - message_id_header: Message-ID header (use with create_draft_reply)
+    - has_attachments: Exact with include_body_preview, otherwise a best guess
+      from the message's MIME type
 
     Use thread_id and email_id with create_draft_reply to respond to emails.
     Use next_page_token with page_token parameter to fetch additional pages.
     """
-    client = get_gmail_client()
+    client = await _client_manager.aget_client()
     emails, has_more, next_page_token = await client.get_unread_emails(
-        max_results=max_results, label_ids=labels, page_token=page_token
+        max_results=max_results,
+        label_ids=labels,
+        page_token=page_token,
+        body_preview=include_body_preview,
     )
+    if not emails and not has_more:
+        return _EMPTY_RESULT
 
     return UnreadEmailsResult(
-        emails=emails,
+        emails=tuple(emails),
         total_count=len(emails),
         has_more=has_more,
         next_page_token=next_page_token,
@@ -118,30 +211,12 @@ async def get_unread_emails(
     },
 )
 async def create_draft_reply(
-    thread_id: Annotated[
-        str,
-        Field(description="Thread ID from get_unread_emails - identifies the conversation"),
-    ],
-    original_message_id: Annotated[
-        str,
-        Field(
-            description="Message ID (email_id from get_unread_emails) - the specific email being replied to"
-        ),
-    ],
-    reply_body: Annotated[
-        str,
-        Field(description="Plain text body of the reply message"),
-    ],
-    original_subject: Annotated[
-        str,
-        Field(
-            description="Subject line of the original email (Re: prefix will be added if needed)"
-        ),
-    ],
-    to_address: Annotated[
-        EmailStr,
-        Field(description="Email address to send the reply to (usually the original sender)"),
-    ],
+    thread_id: ThreadId,
+    original_message_id: OriginalMessageId,
+    reply_body: ReplyBody,
+    original_subject: OriginalSubject,
+    to_address: ToAddress,
+    original_message_id_header: OriginalMessageIdHeader = None,
 ) -> DraftReplyResult:
     """Create a draft reply in an existing email thread.
 
@@ -152,19 +227,30 @@ async def create_draft_reply(
 
     The draft can be reviewed and sent from Gmail web or mobile app.
     """
-    client = get_gmail_client()
+    client = await _client_manager.aget_client()
     return await client.create_draft_reply(
         thread_id=thread_id,
         original_message_id=original_message_id,
         reply_body=reply_body,
         original_subject=original_subject,
         to_address=to_address,
+        original_msgid_header=original_message_id_header,
     )
 
 
 def main() -> None:
-    """Entry point for CLI."""
-    mcp.run()
+    """Entry point for CLI.
+
+    Runs on uvloop when the optional "fast" extra is installed.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        mcp.run()
+        return
+
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        runner.run(mcp.run_async())
 
 
 if __name__ == "__main__":
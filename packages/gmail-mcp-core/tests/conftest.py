@@ -40,54 +40,111 @@ def sample_message_list() -> dict[str, Any]:
     }
 
 
-@pytest.fixture
-def mock_gmail_service(
-    sample_message: dict[str, Any], sample_message_list: dict[str, Any]
-) -> MagicMock:
-    """Mock Gmail API service."""
-    service = MagicMock()
-
-    # Mock messages().list()
-    service.users().messages().list().execute.return_value = sample_message_list
-
-    # Mock messages().get() - return sample message for any ID
-    service.users().messages().get().execute.return_value = sample_message
-
-    # Mock batch requests - execute callback immediately with sample data
-    def mock_batch_execute(batch_request: MagicMock) -> None:
-        # Call the callback for each added request
-        if hasattr(batch_request, "_callbacks"):
-            for request_id, callback in batch_request._callbacks.items():
-                callback(request_id, sample_message, None)
-
-    # Track batch request additions
-    def create_batch_request(callback: Any = None) -> MagicMock:
-        batch = MagicMock()
-        batch._callbacks = {}
-        batch._global_callback = callback
-
-        def add_request(request: Any, request_id: str | None = None) -> None:
-            if callback:
-                batch._callbacks[request_id] = callback
-
-        batch.add = add_request
-        batch.execute = lambda: mock_batch_execute(batch)
+class FakeRequest:
+    """Stand-in for googleapiclient's HttpRequest that returns a canned response."""
+
+    def __init__(self, service: "FakeGmailService", method: str, response: dict[str, Any]) -> None:
+        self.method = method
+        self._service = service
+        self._response = response
+
+    def execute(self, http: Any = None, num_retries: int = 0) -> dict[str, Any]:
+        """Return the response, recording the retry budget the caller asked for."""
+        self._service.executed.append((self, num_retries))
+        return self._response
+
+
+class FakeBatch:
+    """Stand-in for BatchHttpRequest that answers each request in turn."""
+
+    def __init__(self, service: "FakeGmailService", callback: Any) -> None:
+        self._service = service
+        self._callback = callback
+        self._requests: list[tuple[str | None, FakeRequest]] = []
+
+    def add(self, request: FakeRequest, request_id: str | None = None) -> None:
+        self._requests.append((request_id, request))
+
+    def execute(self, http: Any = None) -> None:
+        if self._service.batch_error is not None:
+            raise self._service.batch_error
+        for request_id, request in self._requests:
+            self._callback(request_id, request._response, None)
+
+
+class FakeGmailService:
+    """Typed fake of the Gmail API Resource.
+
+    users(), messages() and drafts() all return the fake itself, since the
+    methods the client calls (list, get, create) don't collide. Every call is
+    recorded in calls as (method, kwargs).
+    """
+
+    # _build_service reads service._http.credentials; None never matches, so
+    # each client builds (and is handed) its own fake
+    _http: Any = None
+
+    def __init__(self, sample_message: dict[str, Any], sample_message_list: dict[str, Any]):
+        self.sample_message = sample_message
+        self.list_response = sample_message_list
+        self.draft_response: dict[str, Any] = {
+            "id": "draft123",
+            "message": {"id": "draftmsg456", "threadId": "thread456"},
+        }
+        # Messages returned by get(), by ID; other IDs get sample_message under that ID
+        self.messages_by_id: dict[str, dict[str, Any]] = {}
+        # Raised by every batch's execute(), e.g. to simulate the batch endpoint failing
+        self.batch_error: Exception | None = None
+        self.calls: list[tuple[str, dict[str, Any]]] = []
+        self.executed: list[tuple[FakeRequest, int]] = []
+        self.batches: list[FakeBatch] = []
+
+    def calls_to(self, method: str) -> list[dict[str, Any]]:
+        """Keyword arguments of each recorded call to method."""
+        return [kwargs for name, kwargs in self.calls if name == method]
+
+    def users(self) -> "FakeGmailService":
+        return self
+
+    def messages(self) -> "FakeGmailService":
+        return self
+
+    def drafts(self) -> "FakeGmailService":
+        return self
+
+    def list(self, **kwargs: Any) -> FakeRequest:
+        self.calls.append(("messages.list", kwargs))
+        return FakeRequest(self, "GET", self.list_response)
+
+    def get(self, **kwargs: Any) -> FakeRequest:
+        self.calls.append(("messages.get", kwargs))
+        message = self.messages_by_id.get(kwargs["id"]) or {
+            **self.sample_message,
+            "id": kwargs["id"],
+        }
+        return FakeRequest(self, "GET", message)
+
+    def create(self, **kwargs: Any) -> FakeRequest:
+        self.calls.append(("drafts.create", kwargs))
+        return FakeRequest(self, "POST", self.draft_response)
+
+    def new_batch_http_request(self, callback: Any = None) -> FakeBatch:
+        batch = FakeBatch(self, callback)
+        self.batches.append(batch)
         return batch
 
-    service.new_batch_http_request = create_batch_request
-
-    # Mock drafts().create()
-    service.users().drafts().create().execute.return_value = {
-        "id": "draft123",
-        "message": {"id": "draftmsg456", "threadId": "thread456"},
-    }
 
-    return service
+@pytest.fixture
+def fake_gmail_service(
+    sample_message: dict[str, Any], sample_message_list: dict[str, Any]
+) -> FakeGmailService:
+    """Fake Gmail API service."""
+    return FakeGmailService(sample_message, sample_message_list)
 
 
 @pytest.fixture
-def gmail_client(mock_gmail_service: MagicMock) -> GmailClient:
-    """Gmail client with mocked service."""
-    with patch("gmail_mcp.gmail.client.build", return_value=mock_gmail_service):
+def gmail_client(fake_gmail_service: FakeGmailService) -> GmailClient:
+    """Gmail client backed by the fake service."""
+    with patch("gmail_mcp.gmail.client.build", return_value=fake_gmail_service):
         client = GmailClient(MagicMock())  # Mock credentials
         return client
@@ -0,0 +1,149 @@
+"""Tests for OAuth credential loading."""
+
+import json
+import stat
+from collections.abc import Iterator
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from google.oauth2.credentials import Credentials
+
+from gmail_mcp.gmail import auth
+from gmail_mcp.gmail.auth import get_credentials
+
+
+@pytest.fixture(autouse=True)
+def clear_credentials_cache() -> Iterator[None]:
+    """Isolate tests from credentials cached (and refreshes scheduled) by earlier tests."""
+    auth._CREDS_CACHE.clear()
+    auth._SAVED_TOKENS.clear()
+    yield
+    auth._CREDS_CACHE.clear()
+    auth._SAVED_TOKENS.clear()
+    for timer in auth._REFRESH_TIMERS.values():
+        timer.cancel()
+    auth._REFRESH_TIMERS.clear()
+
+
+@pytest.fixture
+def token_path(tmp_path: Path) -> Path:
+    """Token file holding an access token that is still valid."""
+    expiry = datetime.now(UTC).replace(tzinfo=None) + timedelta(hours=1)
+    path = tmp_path / "token.json"
+    path.write_text(
+        json.dumps(
+            {
+                "token": "access-token",
+                "refresh_token": "refresh-token",
+                "client_id": "client-id",
+                "client_secret": "client-secret",
+                "expiry": expiry.isoformat() + "Z",
+            }
+        )
+    )
+    return path
+
+
+class TestGetCredentials:
+    """Tests for get_credentials."""
+
+    def test_loads_valid_token(self, tmp_path: Path, token_path: Path) -> None:
+        """Test a valid token file is loaded without re-authenticating."""
+        creds = get_credentials(tmp_path / "credentials.json", token_path)
+
+        assert creds.valid
+        assert creds.token == "access-token"
+
+    def test_reuses_cached_credentials(self, tmp_path: Path, token_path: Path) -> None:
+        """Test repeated calls return the cached object without re-reading the token."""
+        credentials_path = tmp_path / "credentials.json"
+        first = get_credentials(credentials_path, token_path)
+
+        with patch.object(Credentials, "from_authorized_user_file") as load:
+            second = get_credentials(credentials_path, token_path)
+
+        assert second is first
+        load.assert_not_called()
+
+    def test_schedules_refresh_before_expiry(self, tmp_path: Path, token_path: Path) -> None:
+        """Test a background refresh is scheduled ahead of token expiry."""
+        get_credentials(tmp_path / "credentials.json", token_path)
+
+        timer = auth._REFRESH_TIMERS[(str(tmp_path / "credentials.json"), str(token_path))]
+        # Token expires in an hour; refresh should fire about five minutes early
+        assert 50 * 60 < timer.interval < 55 * 60
+
+
+class TestRefreshInBackground:
+    """Tests for _refresh_in_background."""
+
+    def test_refresh_persists_token_and_reschedules(self, tmp_path: Path, token_path: Path) -> None:
+        """Test a successful refresh saves the new token and schedules the next one."""
+        key = (str(tmp_path / "credentials.json"), str(token_path))
+        creds = Credentials.from_authorized_user_file(str(token_path))
+        auth._CREDS_CACHE[key] = creds
+
+        def refresh(request: object) -> None:
+            creds.token = "new-access-token"
+            creds.expiry = datetime.now(UTC).replace(tzinfo=None) + timedelta(hours=1)
+
+        with patch.object(Credentials, "refresh", side_effect=refresh):
+            auth._refresh_in_background(key, token_path)
+
+        assert json.loads(token_path.read_text())["token"] == "new-access-token"
+        assert 50 * 60 < auth._REFRESH_TIMERS[key].interval < 55 * 60
+
+    def test_failed_refresh_schedules_retry(self, tmp_path: Path, token_path: Path) -> None:
+        """Test a failed refresh is retried shortly instead of never again."""
+        key = (str(tmp_path / "credentials.json"), str(token_path))
+        auth._CREDS_CACHE[key] = Credentials.from_authorized_user_file(str(token_path))
+
+        with patch.object(Credentials, "refresh", side_effect=OSError("network down")):
+            auth._refresh_in_background(key, token_path)
+
+        assert auth._REFRESH_TIMERS[key].interval == 30
+        assert json.loads(token_path.read_text())["token"] == "access-token"
+
+    def test_retry_never_lands_after_expiry(self, tmp_path: Path, token_path: Path) -> None:
+        """Test the retry delay is cut short when the token expires sooner."""
+        key = (str(tmp_path / "credentials.json"), str(token_path))
+        creds = Credentials.from_authorized_user_file(str(token_path))
+        creds.expiry = datetime.now(UTC).replace(tzinfo=None) + timedelta(seconds=10)
+        auth._CREDS_CACHE[key] = creds
+
+        with patch.object(Credentials, "refresh", side_effect=OSError("network down")):
+            auth._refresh_in_background(key, token_path)
+
+        assert 0 < auth._REFRESH_TIMERS[key].interval <= 10
+
+
+class TestSaveToken:
+    """Tests for _save_token."""
+
+    def test_skips_unchanged_token(self, tmp_path: Path, token_path: Path) -> None:
+        """Test saving a token identical to the last one written leaves the file alone."""
+        creds = Credentials.from_authorized_user_file(str(token_path))
+        path = tmp_path / "saved" / "token.json"
+
+        auth._save_token(creds, path)
+        assert json.loads(path.read_text())["token"] == "access-token"
+
+        path.write_text("untouched")
+        auth._save_token(creds, path)
+        assert path.read_text() == "untouched"
+
+        creds.token = "new-access-token"
+        auth._save_token(creds, path)
+        assert json.loads(path.read_text())["token"] == "new-access-token"
+
+    def test_writes_owner_only_without_leftovers(self, tmp_path: Path, token_path: Path) -> None:
+        """Test the token is written owner-only and no temporary file is left behind."""
+        creds = Credentials.from_authorized_user_file(str(token_path))
+        path = tmp_path / "saved" / "token.json"
+
+        auth._save_token(creds, path)
+
+        assert stat.S_IMODE(path.stat().st_mode) == 0o600
+        assert [p.name for p in path.parent.iterdir()] == ["token.json"]
@@ -0,0 +1,77 @@
+"""Tests for the persistent message cache."""
+
+import os
+import sqlite3
+import stat
+from datetime import UTC, datetime
+from pathlib import Path
+
+from gmail_mcp.gmail.cache import MessageCache
+from gmail_mcp.gmail.models import EmailSummary
+
+
+def _summary(email_id: str) -> EmailSummary:
+    return EmailSummary(
+        email_id=email_id,
+        thread_id="thread456",
+        sender="test@example.com",
+        subject="Test Subject",
+        snippet="Short preview",
+        body_preview="Full body preview text",
+        received_at=datetime.now(UTC),
+        labels=["INBOX", "UNREAD"],
+    )
+
+
+class TestMessageCache:
+    """Tests for MessageCache."""
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        """Test stored summaries are returned with their historyId."""
+        cache = MessageCache(tmp_path / "cache.db")
+        summary = _summary("msg123")
+        cache.put_many([(summary, "h1", True)])
+
+        hits = cache.get_many(["msg123", "missing"])
+
+        assert list(hits) == ["msg123"]
+        assert hits["msg123"] == (summary, "h1", True)
+
+    def test_require_body_skips_metadata_entries(self, tmp_path: Path) -> None:
+        """Test entries cached without a body are misses when a body is required."""
+        cache = MessageCache(tmp_path / "cache.db")
+        cache.put_many([(_summary("msg123"), "h1", False)])
+
+        assert cache.get_many(["msg123"], require_body=True) == {}
+        assert "msg123" in cache.get_many(["msg123"])
+
+    def test_persists_across_instances(self, tmp_path: Path) -> None:
+        """Test entries survive reopening the database."""
+        path = tmp_path / "cache.db"
+        cache = MessageCache(path)
+        cache.put_many([(_summary("msg123"), None, True)])
+        cache.close()
+
+        assert "msg123" in MessageCache(path).get_many(["msg123"])
+
+    def test_unreadable_entries_are_misses(self, tmp_path: Path) -> None:
+        """Test rows that no longer validate are skipped instead of failing the lookup."""
+        path = tmp_path / "cache.db"
+        cache = MessageCache(path)
+        cache.put_many([(_summary("msg123"), "h1", True), (_summary("msg456"), "h1", True)])
+        with sqlite3.connect(path) as conn:
+            conn.execute(
+                "UPDATE messages SET summary = ? WHERE email_id = ?",
+                ('{"email_id": "msg456", "unknown_field": 1}', "msg456"),
+            )
+
+        assert list(cache.get_many(["msg123", "msg456"])) == ["msg123"]
+
+    def test_database_files_are_owner_only(self, tmp_path: Path) -> None:
+        """Test the database and its WAL side files are created 0600."""
+        path = tmp_path / "cache.db"
+        cache = MessageCache(path)
+        cache.put_many([(_summary("msg123"), None, True)])
+
+        for file in (path, path.with_name("cache.db-wal"), path.with_name("cache.db-shm")):
+            assert stat.S_IMODE(os.stat(file).st_mode) == 0o600
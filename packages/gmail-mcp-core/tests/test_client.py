@@ -1,8 +1,23 @@
 """Tests for Gmail API client."""
 
+import asyncio
+import base64
+import threading
+from datetime import UTC, datetime
+from email import message_from_bytes, policy
+from email.utils import parseaddr
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import httplib2
 import pytest
+from googleapiclient.errors import HttpError
 
-from gmail_mcp.gmail.client import GmailClient
+from gmail_mcp.gmail.client import GmailClient, _OrjsonModel, _parse_date, _parse_date_cached
+from gmail_mcp.gmail.exceptions import GmailAPIError, GmailPermissionError
+from gmail_mcp.gmail.models import EmailSummary
+from tests.conftest import FakeGmailService
 
 
 class TestGmailClient:
@@ -18,6 +33,65 @@ class TestGmailClient:
         assert has_more is False
         assert next_page_token is None
 
+    @pytest.mark.asyncio
+    async def test_get_unread_emails_shards_large_batches(
+        self, gmail_client: GmailClient, fake_gmail_service: FakeGmailService
+    ) -> None:
+        """Test listings over one shard are fetched as several concurrent batches."""
+        fake_gmail_service.list_response = {
+            "messages": [{"id": f"msg{i}", "threadId": f"thread{i}"} for i in range(45)],
+        }
+
+        emails, _, _ = await gmail_client.get_unread_emails(max_results=45)
+
+        assert [email.email_id for email in emails] == [f"msg{i}" for i in range(45)]
+        assert len(fake_gmail_service.batches) == 3
+
+    @pytest.mark.asyncio
+    async def test_get_unread_emails_falls_back_when_batch_unavailable(
+        self, gmail_client: GmailClient, fake_gmail_service: FakeGmailService
+    ) -> None:
+        """Test a 5xx from the batch endpoint falls back to individual requests."""
+        fake_gmail_service.batch_error = HttpError(httplib2.Response({"status": 503}), b"")
+
+        emails, _, _ = await gmail_client.get_unread_emails()
+
+        assert [email.email_id for email in emails] == ["msg123", "msg789"]
+        # The listing itself plus one retried GET per message
+        gets = [retries for request, retries in fake_gmail_service.executed[1:]]
+        assert len(gets) == 2
+        assert all(retries > 0 for retries in gets)
+
+    @pytest.mark.asyncio
+    async def test_get_unread_emails_fetches_metadata_by_default(
+        self, gmail_client: GmailClient, fake_gmail_service: FakeGmailService
+    ) -> None:
+        """Test listings fetch only summary headers unless bodies are requested."""
+        await gmail_client.get_unread_emails()
+        kwargs = fake_gmail_service.calls_to("messages.get")[-1]
+        assert kwargs["format"] == "metadata"
+        assert {name.lower() for name in kwargs["metadataHeaders"]} == {
+            "from",
+            "subject",
+            "date",
+            "message-id",
+        }
+
+        await gmail_client.get_unread_emails(body_preview=True)
+        assert fake_gmail_service.calls_to("messages.get")[-1]["format"] == "full"
+
+    @pytest.mark.asyncio
+    async def test_get_unread_emails_body_preview_shows_more_than_snippet(
+        self, gmail_client: GmailClient, sample_message: dict[str, Any]
+    ) -> None:
+        """Test requesting bodies previews ~500 chars of a long body, not the snippet."""
+        sample_message["snippet"] = "x" * 200
+        sample_message["payload"]["body"]["data"] = base64.urlsafe_b64encode(b"y" * 1000).decode()
+
+        emails, _, _ = await gmail_client.get_unread_emails(body_preview=True)
+
+        assert emails[0].body_preview == "y" * 500
+
     @pytest.mark.asyncio
     async def test_get_unread_emails_parses_sender(self, gmail_client: GmailClient) -> None:
         """Test get_unread_emails correctly parses sender."""
@@ -40,6 +114,7 @@ class TestGmailClient:
 
         assert emails[0].email_id == "msg123"
         assert emails[0].thread_id == "thread456"
+        assert emails[0].message_id_header == "<abc123@mail.gmail.com>"
 
     @pytest.mark.asyncio
     async def test_create_draft_reply_returns_result(self, gmail_client: GmailClient) -> None:
@@ -56,6 +131,248 @@ class TestGmailClient:
         assert result.thread_id == "thread456"
         assert result.message_id == "draftmsg456"
 
+    @pytest.mark.asyncio
+    async def test_create_draft_reply_with_known_header_skips_lookup(
+        self, gmail_client: GmailClient, fake_gmail_service: FakeGmailService
+    ) -> None:
+        """Test passing the Message-ID header avoids fetching the original message."""
+        result = await gmail_client.create_draft_reply(
+            thread_id="thread456",
+            original_message_id="msg123",
+            reply_body="Thanks!",
+            original_subject="Test Email Subject",
+            to_address="john@example.com",
+            original_msgid_header="<abc123@mail.gmail.com>",
+        )
+
+        assert result.draft_id == "draft123"
+        assert fake_gmail_service.calls_to("messages.get") == []
+
+    @pytest.mark.asyncio
+    async def test_create_draft_reply_builds_threaded_message(
+        self, gmail_client: GmailClient, fake_gmail_service: FakeGmailService
+    ) -> None:
+        """Test the draft raw message carries threading headers and the body."""
+        await gmail_client.create_draft_reply(
+            thread_id="thread456",
+            original_message_id="msg123",
+            reply_body="Danke schön!",
+            original_subject="Test Email Subject",
+            to_address="john@example.com",
+        )
+
+        body = fake_gmail_service.calls_to("drafts.create")[-1]["body"]
+        raw = base64.urlsafe_b64decode(body["message"]["raw"])
+        message = message_from_bytes(raw, policy=policy.default)
+
+        assert body["message"]["threadId"] == "thread456"
+        assert message["To"] == "john@example.com"
+        assert message["Subject"] == "Re: Test Email Subject"
+        assert message["In-Reply-To"] == "<abc123@mail.gmail.com>"
+        assert message["References"] == "<abc123@mail.gmail.com>"
+        assert message.get_content().strip() == "Danke schön!"
+
+    @pytest.mark.asyncio
+    async def test_create_draft_reply_encodes_non_ascii_headers(
+        self, gmail_client: GmailClient, fake_gmail_service: FakeGmailService
+    ) -> None:
+        """Test non-ASCII and overlong headers are encoded and folded, and survive parsing."""
+        subject = "Grüße " + "lang " * 250
+        await gmail_client.create_draft_reply(
+            thread_id="thread456",
+            original_message_id="msg123",
+            reply_body="Danke!",
+            original_subject=subject,
+            to_address="Zoë Müller <zoe@example.com>",
+            original_msgid_header="<abc123@mail.gmail.com>",
+        )
+
+        body = fake_gmail_service.calls_to("drafts.create")[-1]["body"]
+        raw = base64.urlsafe_b64decode(body["message"]["raw"])
+        message = message_from_bytes(raw, policy=policy.default)
+
+        assert max(len(line) for line in raw.split(b"\r\n")) <= 998
+        assert message["To"] == "Zoë Müller <zoe@example.com>"
+        assert message["Subject"] == f"Re: {subject}"
+        assert message["In-Reply-To"] == "<abc123@mail.gmail.com>"
+        assert message.get_content().strip() == "Danke!"
+
+    @pytest.mark.asyncio
+    async def test_create_draft_reply_normalizes_line_endings(
+        self, gmail_client: GmailClient, fake_gmail_service: FakeGmailService
+    ) -> None:
+        """Test bare CRs and LFs in the body all become CRLF."""
+        await gmail_client.create_draft_reply(
+            thread_id="thread456",
+            original_message_id="msg123",
+            reply_body="one\rtwo\r\nthree\nfour",
+            original_subject="Test Email Subject",
+            to_address="john@example.com",
+            original_msgid_header="<abc123@mail.gmail.com>",
+        )
+
+        body = fake_gmail_service.calls_to("drafts.create")[-1]["body"]
+        raw = base64.urlsafe_b64decode(body["message"]["raw"])
+
+        assert raw.endswith(b"\r\n\r\none\r\ntwo\r\nthree\r\nfour")
+        assert b"\r" not in raw.replace(b"\r\n", b"")
+
+    @pytest.mark.parametrize("to_address", ["john@example.com", "Zoë Müller <zoe@example.com>"])
+    @pytest.mark.asyncio
+    async def test_create_draft_reply_wraps_overlong_body_lines(
+        self, gmail_client: GmailClient, fake_gmail_service: FakeGmailService, to_address: str
+    ) -> None:
+        """Test body lines over 998 octets are quoted-printable encoded and round-trip."""
+        reply_body = "Short line\n" + "wörter " * 300
+        await gmail_client.create_draft_reply(
+            thread_id="thread456",
+            original_message_id="msg123",
+            reply_body=reply_body,
+            original_subject="Test Email Subject",
+            to_address=to_address,
+            original_msgid_header="<abc123@mail.gmail.com>",
+        )
+
+        body = fake_gmail_service.calls_to("drafts.create")[-1]["body"]
+        raw = base64.urlsafe_b64decode(body["message"]["raw"])
+        message = message_from_bytes(raw, policy=policy.default)
+
+        assert max(len(line) for line in raw.split(b"\r\n")) <= 998
+        assert message["Content-Transfer-Encoding"] == "quoted-printable"
+        assert message.get_content().replace("\r\n", "\n").rstrip("\n") == reply_body
+
+    @pytest.mark.asyncio
+    async def test_concurrent_draft_replies_share_one_batch(
+        self, gmail_client: GmailClient, fake_gmail_service: FakeGmailService
+    ) -> None:
+        """Test drafts created back to back are coalesced into a single batch."""
+        results = await asyncio.gather(
+            *(
+                gmail_client.create_draft_reply(
+                    thread_id="thread456",
+                    original_message_id="msg123",
+                    reply_body=f"Reply {i}",
+                    original_subject="Test Email Subject",
+                    to_address="john@example.com",
+                    original_msgid_header="<abc123@mail.gmail.com>",
+                )
+                for i in range(3)
+            )
+        )
+
+        assert [result.draft_id for result in results] == ["draft123"] * 3
+        assert len(fake_gmail_service.batches) == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_coalesced_batch_reports_each_callers_context(
+        self, gmail_client: GmailClient, fake_gmail_service: FakeGmailService
+    ) -> None:
+        """Test a 4xx on a shared batch is reported as the caller's own operation."""
+        fake_gmail_service.batch_error = HttpError(httplib2.Response({"status": 403}), b"")
+        drafts = [
+            gmail_client.create_draft_reply(
+                thread_id="thread456",
+                original_message_id="msg123",
+                reply_body=f"Reply {i}",
+                original_subject="Test Email Subject",
+                to_address="john@example.com",
+                original_msgid_header="<abc123@mail.gmail.com>",
+            )
+            for i in range(2)
+        ]
+
+        results = await asyncio.gather(*drafts, return_exceptions=True)
+
+        assert all(isinstance(result, GmailPermissionError) for result in results)
+        assert all(result.operation == "create draft" for result in results)
+
+    @pytest.mark.asyncio
+    async def test_failed_coalesced_batch_never_replays_creates(
+        self, gmail_client: GmailClient, fake_gmail_service: FakeGmailService
+    ) -> None:
+        """Test a 5xx on a shared batch fails drafts instead of re-sending them."""
+        fake_gmail_service.batch_error = HttpError(httplib2.Response({"status": 503}), b"")
+        drafts = [
+            gmail_client.create_draft_reply(
+                thread_id="thread456",
+                original_message_id="msg123",
+                reply_body=f"Reply {i}",
+                original_subject="Test Email Subject",
+                to_address="john@example.com",
+                original_msgid_header="<abc123@mail.gmail.com>",
+            )
+            for i in range(2)
+        ]
+
+        results = await asyncio.gather(*drafts, return_exceptions=True)
+
+        assert all(isinstance(result, GmailAPIError) for result in results)
+        assert all(result.status_code == 503 for result in results)
+        assert not [
+            request for request, _ in fake_gmail_service.executed if request.method == "POST"
+        ]
+
+    @pytest.mark.asyncio
+    async def test_create_draft_reply_after_close_fails_instead_of_hanging(
+        self, gmail_client: GmailClient
+    ) -> None:
+        """Test requests submitted to a closed client fail rather than wait forever."""
+        await gmail_client.aclose()
+
+        with pytest.raises(GmailAPIError, match="Request not sent"):
+            await asyncio.wait_for(
+                gmail_client.create_draft_reply(
+                    thread_id="thread456",
+                    original_message_id="msg123",
+                    reply_body="Reply",
+                    original_subject="Test Email Subject",
+                    to_address="john@example.com",
+                    original_msgid_header="<abc123@mail.gmail.com>",
+                ),
+                timeout=5,
+            )
+
+    @pytest.mark.asyncio
+    async def test_aclose_sends_requests_waiting_for_their_batch(
+        self, gmail_client: GmailClient
+    ) -> None:
+        """Test closing the client completes queued requests instead of dropping them."""
+        gmail_client._coalescer._max_wait = 60
+        draft = asyncio.create_task(
+            gmail_client.create_draft_reply(
+                thread_id="thread456",
+                original_message_id="msg123",
+                reply_body="Reply",
+                original_subject="Test Email Subject",
+                to_address="john@example.com",
+                original_msgid_header="<abc123@mail.gmail.com>",
+            )
+        )
+        await asyncio.sleep(0)
+
+        await gmail_client.aclose()
+
+        result = await asyncio.wait_for(draft, timeout=5)
+        assert result.draft_id == "draft123"
+
+    @pytest.mark.asyncio
+    async def test_api_calls_run_on_dedicated_executor(self, gmail_client: GmailClient) -> None:
+        """Test blocking API work runs on the client's own worker threads."""
+        thread_names: list[str] = []
+        parse = gmail_client._parse_message
+
+        def recording_parse(msg: dict[str, Any], body_preview: bool = False) -> EmailSummary:
+            thread_names.append(threading.current_thread().name)
+            return parse(msg, body_preview)
+
+        with patch.object(gmail_client, "_parse_message", side_effect=recording_parse):
+            await gmail_client.get_unread_emails()
+
+        assert thread_names
+        assert all(name.startswith("gmail_") for name in thread_names)
+
+        await gmail_client.aclose()
+
 
 class TestGmailClientParsing:
     """Tests for Gmail client parsing methods."""
@@ -84,3 +401,185 @@ class TestGmailClientParsing:
         """Test extracting email when only email present."""
         email = gmail_client._extract_email("john@example.com")
         assert email == "john@example.com"
+
+    @pytest.mark.asyncio
+    async def test_from_header_parsed_once_per_message(self, gmail_client: GmailClient) -> None:
+        """Test listing parses each From header with a single parseaddr call."""
+        with patch("gmail_mcp.gmail.client.parseaddr", wraps=parseaddr) as spy:
+            emails, _, _ = await gmail_client.get_unread_emails()
+
+        assert spy.call_count == len(emails)
+
+    def test_extract_name_decodes_encoded_words(self, gmail_client: GmailClient) -> None:
+        """Test RFC 2047 encoded display names are decoded."""
+        name = gmail_client._extract_name("=?utf-8?q?Ren=C3=A9e_M=C3=BCller?= <renee@example.com>")
+        assert name == "Renée Müller"
+
+    def test_extract_email_with_quoted_comma_name(self, gmail_client: GmailClient) -> None:
+        """Test extracting name and email when the quoted display name contains a comma."""
+        header = '"Doe, John" <john@example.com>'
+        assert gmail_client._extract_name(header) == "Doe, John"
+        assert gmail_client._extract_email(header) == "john@example.com"
+
+    def test_extract_email_with_unquoted_comma_name(self, gmail_client: GmailClient) -> None:
+        """Test an unquoted display name with a comma still yields the bracketed address."""
+        header = "Doe, John <john@example.com>"
+        assert gmail_client._extract_name(header) == "Doe, John"
+        assert gmail_client._extract_email(header) == "john@example.com"
+
+    def test_extract_email_without_address(self, gmail_client: GmailClient) -> None:
+        """Test a header with no address is kept whole rather than cut at a space."""
+        assert gmail_client._extract_name("John Doe") is None
+        assert gmail_client._extract_email("John Doe") == "John Doe"
+
+    def test_extract_body_from_nested_parts(self, gmail_client: GmailClient) -> None:
+        """Test the first text/plain part is found inside nested multiparts."""
+        payload = {
+            "mimeType": "multipart/mixed",
+            "body": {},
+            "parts": [
+                {
+                    "mimeType": "multipart/alternative",
+                    "body": {},
+                    "parts": [
+                        {"mimeType": "text/html", "body": {"data": "PGI-SGk8L2I-"}},
+                        {"mimeType": "text/plain", "body": {"data": "SGVsbG8gV29ybGQh"}},
+                    ],
+                },
+                {"mimeType": "application/pdf", "filename": "a.pdf", "body": {}},
+            ],
+        }
+
+        assert gmail_client._extract_body(payload) == "Hello World!"
+        assert gmail_client._extract_body(payload, max_chars=5) == "Hello"
+        assert gmail_client._has_attachments(payload) is True
+
+    def test_extract_body_skips_html_only_message(self, gmail_client: GmailClient) -> None:
+        """Test HTML bodies are not decoded into the preview."""
+        payload = {"mimeType": "text/html", "body": {"data": "PGI-SGk8L2I-"}}
+
+        assert gmail_client._extract_body(payload) == ""
+
+    def test_has_attachments_without_files(self, gmail_client: GmailClient) -> None:
+        """Test messages without filenames report no attachments."""
+        payload = {"parts": [{"mimeType": "text/plain", "parts": [{"mimeType": "text/plain"}]}]}
+
+        assert gmail_client._has_attachments(payload) is False
+
+    def test_has_attachments_from_metadata_mime_type(self, gmail_client: GmailClient) -> None:
+        """Test metadata-format payloads (no parts) infer attachments from the MIME type."""
+        assert gmail_client._has_attachments({"mimeType": "multipart/mixed", "headers": []})
+        assert not gmail_client._has_attachments(
+            {"mimeType": "multipart/alternative", "headers": []}
+        )
+
+    def test_parse_message_without_body_uses_snippet(
+        self, gmail_client: GmailClient, sample_message: dict[str, Any]
+    ) -> None:
+        """Test metadata-only messages fall back to the unescaped snippet."""
+        sample_message["snippet"] = "It&#39;s a test"
+        sample_message["payload"] = {"headers": sample_message["payload"]["headers"]}
+
+        email = gmail_client._parse_message(sample_message)
+
+        assert email.body_preview == "It's a test"
+        assert email.snippet == "It&#39;s a test"
+
+    def test_parse_message_without_bodies_skips_decoding(
+        self, gmail_client: GmailClient, sample_message: dict[str, Any]
+    ) -> None:
+        """Test the snippet is the preview, without decoding, unless bodies were fetched."""
+        sample_message["snippet"] = "x" * 200
+
+        with patch.object(gmail_client, "_extract_body") as extract_body:
+            email = gmail_client._parse_message(sample_message)
+
+        assert email.body_preview == "x" * 200
+        extract_body.assert_not_called()
+
+    def test_parse_message_with_body_previews_past_the_snippet(
+        self, gmail_client: GmailClient, sample_message: dict[str, Any]
+    ) -> None:
+        """Test fetched bodies give a ~500-char preview even when the snippet is full length."""
+        sample_message["snippet"] = "x" * 200
+        sample_message["payload"]["body"]["data"] = base64.urlsafe_b64encode(b"y" * 1000).decode()
+
+        email = gmail_client._parse_message(sample_message, body_preview=True)
+
+        assert email.body_preview == "y" * 500
+
+    def test_parse_message_shares_label_lists(
+        self, gmail_client: GmailClient, sample_message: dict[str, Any]
+    ) -> None:
+        """Test summaries with the same labels reference one shared tuple."""
+        first = gmail_client._parse_message(sample_message)
+        second = gmail_client._parse_message({**sample_message, "labelIds": ["INBOX", "UNREAD"]})
+
+        assert first.labels == ("INBOX", "UNREAD")
+        assert second.labels is first.labels
+
+
+class TestGmailClientCache:
+    """Tests for GmailClient with a message cache."""
+
+    @pytest.mark.asyncio
+    async def test_cache_hits_fetch_minimal_format(
+        self, fake_gmail_service: FakeGmailService, tmp_path: Path
+    ) -> None:
+        """Test cached messages are re-fetched only in minimal format."""
+        with patch("gmail_mcp.gmail.client.build", return_value=fake_gmail_service):
+            client = GmailClient(MagicMock(), cache_path=tmp_path / "cache.db")
+
+        first, _, _ = await client.get_unread_emails()
+        assert fake_gmail_service.calls_to("messages.get")[-1]["format"] == "metadata"
+
+        fake_gmail_service.calls.clear()
+        second, _, _ = await client.get_unread_emails()
+        formats = {
+            call["id"]: call["format"] for call in fake_gmail_service.calls_to("messages.get")
+        }
+        assert formats["msg123"] == "minimal"
+        assert second == first
+
+
+class TestOrjsonModel:
+    """Tests for the orjson-backed request/response model."""
+
+    def test_round_trip(self) -> None:
+        """Test bodies survive serialize/deserialize."""
+        model = _OrjsonModel()
+        body = {"message": {"raw": "abc", "threadId": "thread456"}}
+
+        serialized = model.serialize(body)
+
+        assert isinstance(serialized, str)
+        assert model.deserialize(serialized.encode("utf-8")) == body
+
+    def test_serialize_escapes_non_ascii(self) -> None:
+        """Test request bodies are ASCII, so their str length is their byte length."""
+        serialized = _OrjsonModel().serialize({"name": "Grüße 日本"})
+
+        assert serialized.isascii()
+        assert _OrjsonModel().deserialize(serialized.encode("ascii")) == {"name": "Grüße 日本"}
+
+    def test_non_json_content_returned_as_text(self) -> None:
+        """Test non-JSON responses are returned as decoded text like JsonModel."""
+        assert _OrjsonModel().deserialize(b"not json") == "not json"
+
+
+class TestParseDate:
+    """Tests for Date header parsing."""
+
+    def test_parses_rfc2822_date(self) -> None:
+        """Test a valid Date header is parsed with its offset."""
+        parsed = _parse_date("Mon, 6 Jan 2025 10:00:00 -0500")
+
+        assert parsed == datetime(2025, 1, 6, 15, 0, tzinfo=UTC)
+
+    def test_invalid_date_falls_back_to_now(self) -> None:
+        """Test unparseable dates fall back to the current time and aren't cached."""
+        _parse_date_cached.cache_clear()
+        before = datetime.now()
+
+        assert _parse_date("not a date") >= before
+        assert _parse_date_cached.cache_info().currsize == 0
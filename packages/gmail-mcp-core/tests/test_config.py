@@ -0,0 +1,29 @@
+"""Tests for server configuration."""
+
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from gmail_mcp.config import Settings
+
+
+class TestSettings:
+    """Tests for Settings."""
+
+    def test_paths_expand_home(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test ~ in configured paths is expanded when settings are loaded."""
+        monkeypatch.setenv("GMAIL_MCP_TOKEN_PATH", "~/gmail-mcp/token.json")
+        monkeypatch.setenv("GMAIL_MCP_CACHE_PATH", "~/gmail-mcp/cache.db")
+
+        settings = Settings(_env_file=None)
+
+        assert settings.token_path == Path.home() / "gmail-mcp" / "token.json"
+        assert settings.cache_path == Path.home() / "gmail-mcp" / "cache.db"
+
+    def test_is_frozen(self) -> None:
+        """Test settings can't be changed after loading."""
+        settings = Settings(_env_file=None)
+
+        with pytest.raises(ValidationError):
+            settings.default_max_results = 20  # type: ignore[misc]
@@ -2,6 +2,9 @@
 
 from datetime import UTC, datetime
 
+import pytest
+from pydantic import ValidationError
+
 from gmail_mcp.gmail.models import DraftReplyResult, EmailSummary, UnreadEmailsResult
 
 
@@ -25,7 +28,7 @@ class TestEmailSummary:
         assert email.sender == "test@example.com"
         assert email.subject == "Test Subject"
         assert email.has_attachments is False
-        assert email.labels == []
+        assert email.labels == ()
 
     def test_create_with_all_fields(self) -> None:
         """Test creating EmailSummary with all fields."""
@@ -44,7 +47,36 @@ class TestEmailSummary:
 
         assert email.sender_name == "Test User"
         assert email.has_attachments is True
-        assert email.labels == ["INBOX", "IMPORTANT"]
+        assert email.labels == ("INBOX", "IMPORTANT")
+
+    def test_is_frozen(self) -> None:
+        """Test EmailSummary instances are immutable."""
+        email = EmailSummary(
+            email_id="msg123",
+            thread_id="thread456",
+            sender="test@example.com",
+            subject="Test Subject",
+            snippet="Short preview",
+            body_preview="Full body preview text",
+            received_at=datetime.now(UTC),
+        )
+
+        with pytest.raises(ValidationError):
+            email.subject = "Changed"  # type: ignore[misc]
+
+    def test_rejects_unknown_fields(self) -> None:
+        """Test unexpected fields are rejected rather than silently dropped."""
+        with pytest.raises(ValidationError):
+            EmailSummary(
+                email_id="msg123",
+                thread_id="thread456",
+                sender="test@example.com",
+                subject="Test Subject",
+                snippet="Short preview",
+                body_preview="Full body preview text",
+                received_at=datetime.now(UTC),
+                unread=True,  # type: ignore[call-arg]
+            )
 
 
 class TestUnreadEmailsResult:
@@ -80,7 +112,7 @@ class TestUnreadEmailsResult:
             has_more=True,
         )
 
-        assert len(result.emails) == 1
+        assert result.emails == (email,)
         assert result.has_more is True
 
 
@@ -0,0 +1,60 @@
+"""Tests for the MCP server wiring."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from gmail_mcp.server import GmailClientManager
+
+
+class TestGmailClientManager:
+    """Tests for GmailClientManager."""
+
+    @pytest.mark.asyncio
+    async def test_aget_client_reuses_existing_client(self) -> None:
+        """Test an existing client is returned without building a new one."""
+        manager = GmailClientManager()
+        client = MagicMock()
+        manager._client = client
+
+        with patch("gmail_mcp.server.get_credentials") as get_credentials:
+            assert await manager.aget_client() is client
+
+        get_credentials.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_aget_client_creates_client_once(self) -> None:
+        """Test the first call builds the client and later calls reuse it."""
+        manager = GmailClientManager()
+
+        with (
+            patch("gmail_mcp.server.get_credentials"),
+            patch("gmail_mcp.server.GmailClient") as client_class,
+        ):
+            first = await manager.aget_client()
+            second = await manager.aget_client()
+
+        assert first is second is client_class.return_value
+        client_class.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_reset_closes_client(self) -> None:
+        """Test resetting closes the current client and discards it."""
+        manager = GmailClientManager()
+        client = MagicMock()
+        client.aclose = AsyncMock()
+        manager._client = client
+
+        await manager.reset()
+
+        client.aclose.assert_awaited_once()
+        assert manager._client is None
+
+    @pytest.mark.asyncio
+    async def test_reset_without_client(self) -> None:
+        """Test resetting before any client was created is a no-op."""
+        manager = GmailClientManager()
+
+        await manager.reset()
+
+        assert manager._client is None
@@ -1,7 +1,7 @@
 """Abstract base class for MCP plugins."""
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, ClassVar
 
 if TYPE_CHECKING:
     from fastmcp import FastMCP
@@ -11,20 +11,25 @@ class MCPPlugin(ABC):
     """Abstract base class for MCP plugins.
 
     Plugins extend MCP servers with additional tools, resources, and functionality.
-    Implement this class to create a custom plugin.
+    Implement this class to create a custom plugin, setting name and version as
+    class attributes so the registry can read them without instantiating it.
     """
 
-    @property
-    @abstractmethod
-    def name(self) -> str:
-        """Unique plugin identifier."""
-        ...
-
-    @property
-    @abstractmethod
-    def version(self) -> str:
-        """Plugin version string (semver recommended)."""
-        ...
+    name: ClassVar[str]
+    """Unique plugin identifier."""
+
+    version: ClassVar[str]
+    """Plugin version string (semver recommended)."""
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Check concrete plugins declare name and version."""
+        super().__init_subclass__(**kwargs)
+        # Abstract intermediate bases can leave these to their subclasses
+        if getattr(cls.register, "__isabstractmethod__", False):
+            return
+        for attr in ("name", "version"):
+            if not isinstance(getattr(cls, attr, None), str):
+                raise TypeError(f"{cls.__name__} must define a str class attribute {attr!r}")
 
     @property
     def description(self) -> str:
@@ -17,6 +17,8 @@ class PluginRegistry:
 
     _plugins: ClassVar[dict[str, type[MCPPlugin]]] = {}
     _instances: ClassVar[dict[str, MCPPlugin]] = {}
+    # Snapshot of _plugins' keys, rebuilt on registration so listing is free
+    _names: ClassVar[tuple[str, ...]] = ()
 
     @classmethod
     def register(cls, plugin_class: type[MCPPlugin]) -> type[MCPPlugin]:
@@ -28,9 +30,9 @@ class PluginRegistry:
         Returns:
             The same plugin class (for use as decorator).
         """
-        # Instantiate to get name
-        instance = plugin_class()
-        cls._plugins[instance.name] = plugin_class
+        # name is a class attribute, so plugins aren't constructed until loaded
+        cls._plugins[plugin_class.name] = plugin_class
+        cls._names = tuple(cls._plugins)
         return plugin_class
 
     @classmethod
@@ -48,13 +50,13 @@ class PluginRegistry:
         return cls._instances.get(name)
 
     @classmethod
-    def list_plugins(cls) -> list[str]:
+    def list_plugins(cls) -> tuple[str, ...]:
         """List all registered plugin names.
 
         Returns:
-            List of registered plugin names.
+            Registered plugin names, in registration order.
         """
-        return list(cls._plugins.keys())
+        return cls._names
 
     @classmethod
     def load_all(cls, mcp: "FastMCP") -> None:
@@ -63,11 +65,12 @@ class PluginRegistry:
         Args:
             mcp: FastMCP server to register plugins with.
         """
-        for name in cls._plugins:
-            plugin = cls.get_plugin(name)
-            if plugin:
-                plugin.initialize()
-                plugin.register(mcp)
+        for name, plugin_class in cls._plugins.items():
+            plugin = cls._instances.get(name)
+            if plugin is None:
+                plugin = cls._instances[name] = plugin_class()
+            plugin.initialize()
+            plugin.register(mcp)
 
     @classmethod
     def unload_all(cls) -> None:
@@ -88,3 +91,4 @@ class PluginRegistry:
         cls.unload_all()
         cls._plugins.clear()
         cls._instances.clear()
+        cls._names = ()
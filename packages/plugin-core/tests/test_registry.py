@@ -0,0 +1,69 @@
+"""Tests for the plugin registry."""
+
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+
+from mcp_plugins import MCPPlugin, PluginRegistry
+
+
+@pytest.fixture(autouse=True)
+def clear_registry() -> Iterator[None]:
+    """Isolate tests from plugins registered by other tests."""
+    PluginRegistry.clear()
+    yield
+    PluginRegistry.clear()
+
+
+class TestPluginRegistry:
+    """Tests for PluginRegistry."""
+
+    def test_register_does_not_instantiate(self) -> None:
+        """Test registering a plugin reads its name without constructing it."""
+        constructed: list[str] = []
+
+        @PluginRegistry.register
+        class EchoPlugin(MCPPlugin):
+            name = "echo"
+            version = "0.1.0"
+
+            def __init__(self) -> None:
+                constructed.append(self.name)
+
+            def register(self, mcp: Any) -> None:
+                pass
+
+        assert PluginRegistry.list_plugins() == ("echo",)
+        assert constructed == []
+
+        plugin = PluginRegistry.get_plugin("echo")
+        assert isinstance(plugin, EchoPlugin)
+        assert constructed == ["echo"]
+
+    def test_load_all_registers_plugins(self) -> None:
+        """Test load_all constructs each plugin and registers it with the server."""
+        servers: list[Any] = []
+
+        @PluginRegistry.register
+        class EchoPlugin(MCPPlugin):
+            name = "echo"
+            version = "0.1.0"
+
+            def register(self, mcp: Any) -> None:
+                servers.append(mcp)
+
+        PluginRegistry.load_all("server")
+
+        assert servers == ["server"]
+        assert isinstance(PluginRegistry.get_plugin("echo"), EchoPlugin)
+
+    def test_plugin_without_name_rejected(self) -> None:
+        """Test concrete plugins must declare name and version class attributes."""
+        with pytest.raises(TypeError, match="'name'"):
+
+            class NamelessPlugin(MCPPlugin):
+                version = "0.1.0"
+
+                def register(self, mcp: Any) -> None:
+                    pass